@@ -1,5 +1,8 @@
 """ChatGPT用プロンプト生成モジュール"""
 
+import functools
+import math
+
 from ..models.hooks import HookItem
 from ..models.transcription import TranscriptionResult, TranscriptionSegment
 
@@ -93,18 +96,12 @@ class PromptBuilder:
 }}"""
 
     # 詳細台本作成用プロンプトテンプレート
+    # OpenAIのプロンプトキャッシュは先頭一致で効くため、固定の指示を先に、入力を末尾に置く。
+    # 同じ動画の全フックで共通のsegmentsを、フックごとに異なるitemより前に置く
     SCRIPT_PROMPT_TEMPLATE = """# ショート動画台本作成プロンプト（本人発言のみ）
 
 あなたは動画編集者のために、Z世代向けショート動画の台本を構成するプロフェッショナルです。
-以下の `item` 情報と `segments`（タイムスタンプ付き文字起こし）をもとに、**1分以内の動画構成案**を出力してください。
-
----
-
-## 入力
-
-- `item`: {{ITEM_PLACEHOLDER}}
-
-- `segments`: {{SEGMENTS_PLACEHOLDER}}
+末尾の `item` 情報と `segments`（タイムスタンプ付き文字起こし）をもとに、**1分以内の動画構成案**を出力してください。
 
 ---
 
@@ -162,7 +159,33 @@ class PromptBuilder:
 9:19.18	社会問題にはITを使って解決できるものが沢山ある
 9:37.33	ぜひサポーター（ボランティア）登録お願いします
 
+---
+
+## 入力
+
+- `segments`: {{SEGMENTS_PLACEHOLDER}}
+
+- `item`: {{ITEM_PLACEHOLDER}}
+"""
+
+    # フック抽出用プロンプトの書式文字列（テンプレート本文の波括弧はエスケープし、末尾の文字起こし部分だけを置換対象にする）
+    _HOOKS_PROMPT_FORMAT = (
+        HOOKS_PROMPT_TEMPLATE.replace("{", "{{").replace("}", "}}")
+        + """
+
+# 動画書き起こし
+
+## 全体テキスト
+{full_text}
+
+## タイムスタンプ付きセグメント
+{segments}
 """
+    )
+
+    # 呼び出しごとにテンプレート全体を置換しないよう、プレースホルダーの位置で事前に分割しておく
+    _SCRIPT_PROMPT_HEAD, _SCRIPT_PROMPT_REST = SCRIPT_PROMPT_TEMPLATE.split("{{SEGMENTS_PLACEHOLDER}}")
+    _SCRIPT_PROMPT_MIDDLE, _SCRIPT_PROMPT_TAIL = _SCRIPT_PROMPT_REST.split("{{ITEM_PLACEHOLDER}}")
 
     def __init__(self) -> None:
         """プロンプトテンプレートを初期化"""
@@ -182,22 +205,8 @@ class PromptBuilder:
         # セグメント情報をフォーマット
         segments_text = self._format_segments(transcription.segments)
 
-        # テンプレートに文字起こし情報を埋め込み
-        prompt = (
-            self.HOOKS_PROMPT_TEMPLATE
-            + f"""
-
-# 動画書き起こし
-
-## 全体テキスト
-{transcription.full_text}
-
-## タイムスタンプ付きセグメント
-{segments_text}
-"""
-        )
-
-        return prompt
+        # テンプレートに文字起こし情報を埋め込み（プロンプトキャッシュが効くよう固定部分を先頭に置く）
+        return self._HOOKS_PROMPT_FORMAT.format(full_text=transcription.full_text, segments=segments_text)
 
     def build_script_prompt(self, hook_item: HookItem, segments: list[TranscriptionSegment]) -> str:
         """詳細台本作成用プロンプトを構築
@@ -210,8 +219,8 @@ class PromptBuilder:
             詳細台本作成用プロンプト
 
         Note:
-            SCRIPT_PROMPT_TEMPLATEの`{{ITEM_PLACEHOLDER}}`と`{{SEGMENTS_PLACEHOLDER}}`を
-            実際のデータで置換する
+            SCRIPT_PROMPT_TEMPLATEの`{{ITEM_PLACEHOLDER}}`と`{{SEGMENTS_PLACEHOLDER}}`の位置に
+            実際のデータを埋め込む
 
         """
         # フック情報をJSON形式で整形
@@ -223,19 +232,12 @@ class PromptBuilder:
 }}"""
 
         # セグメント情報を簡潔なフォーマットで整形
-        segments_text = ""
-        for segment in segments:
-            # 開始時刻を分:秒.小数点形式に変換
-            start_time_formatted = self._format_time_to_minutes_seconds(segment.start_time)
-            segments_text += f"{start_time_formatted} {segment.text}\n"
-        segments_text = segments_text.rstrip("\n")
-
-        # テンプレートのプレースホルダーを置換
-        prompt = self.SCRIPT_PROMPT_TEMPLATE
-
-        # プレースホルダーを置換
-        prompt = prompt.replace("{{ITEM_PLACEHOLDER}}", item_json)
-        prompt = prompt.replace("{{SEGMENTS_PLACEHOLDER}}", segments_text)
+        # 開始時刻は分:秒.小数点形式に変換し、1行ずつ連結せずまとめてjoinする
+        format_time = self._format_time_to_minutes_seconds
+        segments_text = "\n".join(f"{format_time(segment.start_time)} {segment.text}" for segment in segments).rstrip("\n")
+
+        # 事前に分割したテンプレートの間にデータを挟み込む
+        prompt = "".join((self._SCRIPT_PROMPT_HEAD, segments_text, self._SCRIPT_PROMPT_MIDDLE, item_json, self._SCRIPT_PROMPT_TAIL))
         print(prompt)
 
         return prompt
@@ -262,9 +264,22 @@ class PromptBuilder:
             hh:mm:ss形式の時刻文字列
 
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        return self._format_whole_seconds_to_hms(math.floor(seconds))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _format_whole_seconds_to_hms(total_seconds: int) -> str:
+        """整数秒をhh:mm:ss形式に変換（結果をキャッシュ）
+
+        Args:
+            total_seconds: 変換する秒数（整数）
+
+        Returns:
+            hh:mm:ss形式の時刻文字列
+
+        """
+        hours, remainder = divmod(total_seconds, 3600)
+        minutes, secs = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
     def _format_time_to_minutes_seconds(self, seconds: float) -> str:
@@ -291,15 +306,11 @@ class PromptBuilder:
             フォーマットされたセグメント文字列
 
         """
-        formatted_lines = []
-        for i, segment in enumerate(segments, 1):
-            start_time = self._format_time_to_hms(segment.start_time)
-            end_time = self._format_time_to_hms(segment.end_time)
-
-            time_range = f"[{start_time} - {end_time}]"
-            formatted_lines.append(f"{i:3d}. {time_range} {segment.text}")
-
-        return "\n".join(formatted_lines)
+        # str.joinは内部で一度リスト化するため、ジェネレータではなくリスト内包表記で行を作る
+        format_time = self._format_time_to_hms
+        return "\n".join(
+            [f"{i:3d}. [{format_time(segment.start_time)} - {format_time(segment.end_time)}] {segment.text}" for i, segment in enumerate(segments, 1)]
+        )
 
     def _validate_transcription(self, transcription: TranscriptionResult) -> None:
         """文字起こし結果の妥当性をチェック
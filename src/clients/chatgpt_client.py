@@ -3,17 +3,22 @@
 import json
 import re
 import time
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ..builders.prompt_builder import PromptBuilder
 
+import orjson
 from openai import OpenAI
 
 from ..models.hooks import DetailedScript, HookItem
 from ..models.transcription import TranscriptionSegment
 
+# Batch APIの完了を待つ最大時間（秒）。完了期限は24時間だが、期限切れの反映が遅れる分を見込んで少し長めにする
+BATCH_MAX_WAIT_SECONDS = 25 * 60 * 60
+
 
 class ChatGPTClientError(Exception):
     """ChatGPTClient関連のベース例外"""
@@ -64,12 +69,26 @@ class ChatGPTClient:
 
     """
 
-    def __init__(self, api_key: str, model: str = "gpt-4") -> None:
+    # フック抽出レスポンスの各アイテムに必要なフィールド
+    REQUIRED_HOOK_FIELDS = ("first_hook", "second_hook", "third_hook", "summary")
+    _REQUIRED_HOOK_FIELD_SET = frozenset(REQUIRED_HOOK_FIELDS)
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        max_concurrency: int = 10,
+        batch_max_wait_seconds: float = BATCH_MAX_WAIT_SECONDS,
+        sleep_fn: Callable[[float], None] | None = None,
+    ) -> None:
         """ChatGPTClientを初期化
 
         Args:
             api_key: OpenAI APIキー
             model: 使用するChatGPTモデル
+            max_concurrency: 詳細台本生成時の最大同時リクエスト数
+            batch_max_wait_seconds: Batch APIの完了を待つ最大時間（秒）
+            sleep_fn: リトライ・ポーリングの待機に使う関数（省略時はtime.sleep、テストでは待機を省略する関数を渡せる）
 
         Raises:
             ValueError: APIキーが無効な場合
@@ -80,6 +99,9 @@ class ChatGPTClient:
 
         self.api_key = api_key
         self.model = model
+        self.max_concurrency = max_concurrency
+        self.batch_max_wait_seconds = batch_max_wait_seconds
+        self._sleep = sleep_fn or time.sleep
         self.client = OpenAI(api_key=api_key)
 
     def _validate_prompt(self, prompt: str) -> None:
@@ -92,12 +114,13 @@ class ChatGPTClient:
             ValueError: プロンプトが無効な場合
 
         """
-        if not prompt or not prompt.strip():
-            raise ValueError("プロンプトが空です")
-
+        # 長さの判定は文字列を走査しないため先に行い、空白判定もコピーを作るstrip()ではなくisspace()で行う
         if len(prompt) > 100000:
             raise ValueError("プロンプトが長すぎます（100,000文字以内）")
 
+        if not prompt or prompt.isspace():
+            raise ValueError("プロンプトが空です")
+
     def _call_chatgpt_api(self, prompt: str, max_retries: int = 3) -> str:
         """リトライ機能付きChatGPT API呼び出し
 
@@ -134,14 +157,105 @@ class ChatGPTClient:
                 if hasattr(e, "status_code") and e.status_code == 429:
                     retry_after = getattr(e, "retry_after", 60)
                     if attempt < max_retries - 1:
-                        time.sleep(retry_after)
+                        self._sleep(retry_after)
                         continue
 
                 if attempt < max_retries - 1:
-                    time.sleep(2**attempt)
+                    self._sleep(2**attempt)
 
         raise ChatGPTAPIError(f"ChatGPT API呼び出しが{max_retries}回失敗しました: {last_exception!s}")
 
+    def _call_chatgpt_batch_api(self, prompts: list[str], poll_interval_seconds: float = 30.0) -> list[str | None]:
+        """Batch APIで複数のプロンプトをまとめて実行
+
+        Batch APIは通常のAPIの半額で利用できる代わりに、完了まで最大24時間かかる。
+
+        Args:
+            prompts: ChatGPTに送信するプロンプトのリスト
+            poll_interval_seconds: バッチの状態を確認する間隔（秒）
+
+        Returns:
+            各プロンプトに対するレスポンステキストのリスト（promptsと同じ順序、失敗したものはNone）
+
+        Raises:
+            ChatGPTAPIError: バッチの作成・実行に失敗した場合、または最大待機時間内に完了しなかった場合
+
+        """
+        try:
+            requests_jsonl = "\n".join(
+                json.dumps(
+                    {
+                        "custom_id": str(i),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.model,
+                            "messages": [{"role": "user", "content": prompt}],
+                            "temperature": 0.7,
+                            "max_tokens": 4000,
+                        },
+                    },
+                    ensure_ascii=False,
+                )
+                for i, prompt in enumerate(prompts)
+            )
+
+            input_file = self.client.files.create(file=("batch_input.jsonl", requests_jsonl.encode("utf-8")), purpose="batch")
+            batch = self.client.batches.create(input_file_id=input_file.id, endpoint="/v1/chat/completions", completion_window="24h")
+            print(f"DEBUG: バッチを作成しました: {batch.id}（{len(prompts)}件）")
+
+            waited_seconds = 0.0
+            while batch.status not in {"completed", "failed", "expired", "cancelled"}:
+                if waited_seconds >= self.batch_max_wait_seconds:
+                    self._cancel_batch(batch.id)
+                    raise ChatGPTAPIError(f"バッチ処理が{self.batch_max_wait_seconds:g}秒以内に完了しませんでした: {batch.id}（{batch.status}）")
+
+                self._sleep(poll_interval_seconds)
+                waited_seconds += poll_interval_seconds
+                batch = self.client.batches.retrieve(batch.id)
+                print(f"DEBUG: バッチ処理状況: {batch.status}")
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise ChatGPTAPIError(f"バッチ処理が完了しませんでした: {batch.status}")
+
+            output_text = self.client.files.content(batch.output_file_id).text
+
+        except ChatGPTAPIError:
+            raise
+        except Exception as e:
+            raise ChatGPTAPIError(f"Batch API呼び出しに失敗しました: {e!s}") from e
+
+        results: list[str | None] = [None] * len(prompts)
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+
+                results[int(record["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                # 形式が不正なレコードは失敗したリクエストと同様に扱い、残りの結果の取得を継続
+                print(f"DEBUG: バッチ出力の不正なレコードをスキップしました: {e!r}")
+
+        return results
+
+    def _cancel_batch(self, batch_id: str) -> None:
+        """待機を打ち切ったバッチをキャンセル
+
+        Args:
+            batch_id: キャンセルするバッチのID
+
+        """
+        try:
+            self.client.batches.cancel(batch_id)
+        except Exception as e:
+            # キャンセルできなくてもバッチは完了期限で終了するため、処理は止めない
+            print(f"DEBUG: バッチのキャンセルに失敗しました: {batch_id} ({e})")
+
     def _parse_json_response(self, raw_response: str) -> dict[str, Any]:
         """レスポンステキストからJSONを抽出・解析
 
@@ -163,12 +277,12 @@ class ChatGPTClient:
 
             cleaned_response = cleaned_response.strip()
 
-            parsed_data = json.loads(cleaned_response)
+            parsed_data = orjson.loads(cleaned_response)
             if not isinstance(parsed_data, dict):
                 raise JSONParseError("レスポンスは辞書形式である必要があります", raw_response)
             return parsed_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise JSONParseError(f"JSONの解析に失敗しました: {e!s}", raw_response) from e
 
     def _parse_time_to_seconds(self, time_str: str) -> float:
@@ -267,8 +381,9 @@ class ChatGPTClient:
         """
         detailed_scripts = []
 
-        # 並列処理（最大5並列）
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # 並列処理（最大max_concurrency並列）
+        # API呼び出しは待ち時間がほとんどのため、フック数が上限以内なら全件を同時に投げる
+        with ThreadPoolExecutor(max_workers=max(1, min(len(hook_items), self.max_concurrency))) as executor:
             # 各フックに対してタスクを投入
             future_to_hook = {}
             for hook_item in hook_items:
@@ -290,6 +405,68 @@ class ChatGPTClient:
 
         return detailed_scripts
 
+    def extract_hooks_batch(self, prompt: str) -> list[HookItem]:
+        """Batch APIを使用したフック抽出
+
+        Args:
+            prompt: フック抽出用プロンプト
+
+        Returns:
+            HookItemのリスト
+
+        Raises:
+            ChatGPTAPIError: API呼び出しに失敗した場合
+            JSONParseError: レスポンスのJSON解析に失敗した場合
+            ValidationError: レスポンス内容が期待する形式でない場合
+
+        """
+        self._validate_prompt(prompt)
+
+        raw_response = self._call_chatgpt_batch_api([prompt])[0]
+        if raw_response is None:
+            raise ChatGPTAPIError("バッチ処理でフック抽出に失敗しました")
+
+        json_data = self._parse_json_response(raw_response)
+        self._validate_hooks_response_structure(json_data)
+
+        return self._convert_to_hook_items(json_data)
+
+    def generate_detailed_scripts_batch(
+        self, hook_items: list[HookItem], segments: list[TranscriptionSegment], prompt_builder: "PromptBuilder"
+    ) -> list[DetailedScript]:
+        """Batch APIを使用して全フックの詳細台本をまとめて生成
+
+        Args:
+            hook_items: フックアイテムのリスト
+            segments: 文字起こしセグメント
+            prompt_builder: プロンプトビルダー
+
+        Returns:
+            詳細台本のリスト（失敗したフックは含まない）
+
+        """
+        prompts = [prompt_builder.build_script_prompt(hook_item, segments) for hook_item in hook_items]
+        for prompt in prompts:
+            self._validate_prompt(prompt)
+
+        detailed_scripts = []
+        for hook_item, raw_response in zip(hook_items, self._call_chatgpt_batch_api(prompts), strict=True):
+            if raw_response is None:
+                # 個別の失敗は警告として記録し、処理を継続
+                print(f"フック '{hook_item.summary}' の台本生成に失敗: バッチ処理でエラーが返されました")
+                continue
+
+            detailed_scripts.append(
+                DetailedScript(
+                    hook_item=hook_item,
+                    script_content=raw_response,
+                    duration_seconds=self._extract_duration_from_script(raw_response),
+                    segments_used=segments,
+                )
+            )
+
+        return detailed_scripts
+
     def _extract_duration_from_script(self, script_content: str) -> int:
         """台本内容から想定時間を抽出
 
@@ -326,27 +503,19 @@ class ChatGPTClient:
         if len(data["items"]) == 0:
             raise ValidationError("'items'が空です")
 
-        required_fields = ["first_hook", "second_hook", "third_hook", "summary"]
-
         for i, item in enumerate(data["items"]):
-            for field in required_fields:
-                if field not in item:
-                    raise ValidationError(
-                        f"アイテム{i}に必須フィールド'{field}'がありません",
-                        field_name=field,
-                    )
+            if not isinstance(item, dict):
+                raise ValidationError(f"アイテム{i}が辞書形式ではありません")
+
+            # 必須フィールドの有無は集合の差でまとめて判定し、不足時のみ定義順で最初のフィールドを報告する
+            missing_fields = self._REQUIRED_HOOK_FIELD_SET - item.keys()
+            if missing_fields:
+                field = next(field for field in self.REQUIRED_HOOK_FIELDS if field in missing_fields)
+                raise ValidationError(
+                    f"アイテム{i}に必須フィールド'{field}'がありません",
+                    field_name=field,
+                )
 
     def _convert_to_hook_items(self, data: dict[str, Any]) -> list[HookItem]:
         """JSONデータをHookItemオブジェクトのリストに変換"""
-        hook_items = []
-
-        for item in data["items"]:
-            hook_item = HookItem(
-                first_hook=item["first_hook"],
-                second_hook=item["second_hook"],
-                third_hook=item["third_hook"],
-                summary=item["summary"],
-            )
-            hook_items.append(hook_item)
-
-        return hook_items
+        return [HookItem.from_dict(item) for item in data["items"]]
@@ -4,16 +4,20 @@ import base64
 import json
 import mimetypes
 import re
+import threading
 from pathlib import Path
 from typing import Any
 
 import google.auth
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.http import MediaFileUpload, MediaInMemoryUpload, MediaIoBaseDownload
 
 from ..models.drive import DriveFile, DriveFolder
 
+# このサイズ以下のファイルはresumableではなくmultipartアップロード（1リクエスト）で送信する
+RESUMABLE_UPLOAD_THRESHOLD_BYTES = 5 * 1024 * 1024
+
 
 class GoogleDriveError(Exception):
     """Google Drive関連のベース例外"""
@@ -114,8 +118,13 @@ class GoogleDriveClient:
         self.video_mime_types = {"video/mp4", "video/avi", "video/quicktime", "video/x-msvideo", "video/x-ms-wmv", "video/x-flv", "video/webm"}
 
         # Google Drive APIサービスを初期化
+        self.credentials: Any = None
         self.service = self._build_service()
 
+        # httplib2はスレッドセーフではないため、別スレッドからのアップロードにはスレッドごとのサービスを使う
+        self._owner_thread_id = threading.get_ident()
+        self._thread_local = threading.local()
+
     def _build_service(self) -> Any:
         """Google Drive APIサービスを構築"""
         try:
@@ -136,6 +145,7 @@ class GoogleDriveClient:
                 credentials, _ = google.auth.default(scopes=self.scopes)
 
             # Google Drive APIサービスを構築
+            self.credentials = credentials
             service = build("drive", "v3", credentials=credentials)
             return service
 
@@ -153,6 +163,22 @@ class GoogleDriveClient:
         except Exception as e:
             raise GoogleDriveError(f"Google Drive APIサービスの初期化に失敗しました: {e!s}") from e
 
+    def _get_thread_service(self) -> Any:
+        """現在のスレッド用のGoogle Drive APIサービスを取得
+
+        Returns:
+            現在のスレッド専用のGoogle Drive APIサービス（初期化したスレッドではself.service）
+
+        """
+        if threading.get_ident() == self._owner_thread_id:
+            return self.service
+
+        service = getattr(self._thread_local, "service", None)
+        if service is None:
+            service = build("drive", "v3", credentials=self.credentials)
+            self._thread_local.service = service
+        return service
+
     def extract_folder_id(self, folder_url: str) -> str:
         """フォルダURLからフォルダIDを抽出
 
@@ -362,6 +388,8 @@ class GoogleDriveClient:
     def upload_file(self, file_path: str, folder_id: str, file_name: str | None = None) -> str:
         """ファイルをGoogle Driveにアップロード
 
+        複数スレッドから同時に呼び出し可能です。
+
         Args:
             file_path: アップロード対象のファイルパス
             folder_id: アップロード先のフォルダID
@@ -387,27 +415,32 @@ class GoogleDriveClient:
 
             file_metadata = {"name": upload_file_name, "parents": [folder_id]}
 
-            media = MediaFileUpload(file_path, mimetype=mime_type, resumable=True)
+            # 小さいファイル（企画書・字幕・文字起こし）はメタデータと本文を1回のPOSTで送る
+            resumable = file_path_obj.stat().st_size > RESUMABLE_UPLOAD_THRESHOLD_BYTES
+            media = MediaFileUpload(file_path, mimetype=mime_type, resumable=resumable)
 
             print(f"DEBUG: ファイルアップロード開始: {upload_file_name}")
 
-            request = self.service.files().create(body=file_metadata, media_body=media, fields="id,webViewLink", supportsAllDrives=True)
+            request = self._get_thread_service().files().create(body=file_metadata, media_body=media, fields="id,webViewLink", supportsAllDrives=True)
 
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    if progress % 25 == 0:
-                        print(f"DEBUG: アップロード進行状況: {progress}%")
+            if resumable:
+                response = None
+                while response is None:
+                    status, response = request.next_chunk()
+                    if status:
+                        progress = int(status.progress() * 100)
+                        if progress % 25 == 0:
+                            print(f"DEBUG: アップロード進行状況: {progress}%")
+            else:
+                response = request.execute()
 
-            file_id = response.get("id")  # type: ignore[unreachable]
+            file_id = response.get("id")
             web_view_link = response.get("webViewLink")
 
             print(f"DEBUG: アップロード完了: {upload_file_name} (ID: {file_id})")
 
             if web_view_link:
-                return web_view_link
+                return str(web_view_link)
             else:
                 raise FileUploadError("アップロード後のURLが取得できませんでした", file_path)
 
@@ -449,7 +482,8 @@ class GoogleDriveClient:
     def folder_exists(self, parent_folder_id: str, folder_name: str) -> bool:
         """指定した親フォルダ内に特定の名前のフォルダが存在するかチェック"""
         try:
-            query = f"'{parent_folder_id}' in parents and name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
+            escaped_name = self._escape_query_value(folder_name)
+            query = f"'{parent_folder_id}' in parents and name='{escaped_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
 
             results = self.service.files().list(q=query, fields="files(id,name)", supportsAllDrives=True, includeItemsFromAllDrives=True).execute()
 
@@ -458,6 +492,117 @@ class GoogleDriveClient:
         except Exception as e:
             raise GoogleDriveError(f"フォルダ存在チェックに失敗しました: {e!s}") from e
 
+    def _escape_query_value(self, value: str) -> str:
+        """Drive APIの検索クエリ（q）に埋め込む文字列をエスケープ
+
+        Args:
+            value: クエリの文字列リテラルに埋め込む値
+
+        Returns:
+            バックスラッシュとシングルクォートをエスケープした文字列
+
+        """
+        return value.replace("\\", "\\\\").replace("'", "\\'")
+
+    def find_folder_id(self, parent_folder_id: str, folder_name: str) -> str | None:
+        """指定した親フォルダ内の特定の名前のフォルダIDを取得
+
+        Args:
+            parent_folder_id: 親フォルダのID
+            folder_name: 検索するフォルダ名
+
+        Returns:
+            フォルダID、存在しない場合はNone
+
+        Raises:
+            GoogleDriveError: 検索に失敗した場合
+
+        """
+        try:
+            escaped_name = self._escape_query_value(folder_name)
+            query = f"'{parent_folder_id}' in parents and name='{escaped_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
+
+            results = self.service.files().list(q=query, fields="files(id)", supportsAllDrives=True, includeItemsFromAllDrives=True).execute()
+
+            folders = results.get("files", [])
+            return str(folders[0]["id"]) if folders else None
+
+        except Exception as e:
+            raise GoogleDriveError(f"フォルダ検索に失敗しました: {e!s}") from e
+
+    def find_files_by_name(self, parent_folder_id: str, file_name: str) -> list[dict[str, Any]]:
+        """指定した親フォルダ内の同名ファイル一覧を取得
+
+        Args:
+            parent_folder_id: 親フォルダのID
+            file_name: 検索するファイル名
+
+        Returns:
+            ファイル情報（id, createdTime）の辞書のリスト
+
+        Raises:
+            GoogleDriveError: 検索に失敗した場合
+
+        """
+        try:
+            query = f"'{parent_folder_id}' in parents and name='{self._escape_query_value(file_name)}' and trashed=false"
+
+            results = self.service.files().list(q=query, fields="files(id,createdTime)", supportsAllDrives=True, includeItemsFromAllDrives=True).execute()
+
+            files: list[dict[str, Any]] = results.get("files", [])
+            return files
+
+        except Exception as e:
+            raise GoogleDriveError(f"ファイル検索に失敗しました: {e!s}") from e
+
+    def upload_bytes(self, data: bytes, folder_id: str, file_name: str, mime_type: str = "application/octet-stream") -> str:
+        """メモリ上のデータをファイルとしてGoogle Driveにアップロード
+
+        Args:
+            data: アップロードするデータ
+            folder_id: アップロード先のフォルダID
+            file_name: アップロード後のファイル名
+            mime_type: MIMEタイプ
+
+        Returns:
+            アップロードされたファイルのID
+
+        Raises:
+            FileUploadError: アップロードに失敗した場合
+
+        """
+        try:
+            file_metadata = {"name": file_name, "parents": [folder_id]}
+            media = MediaInMemoryUpload(data, mimetype=mime_type, resumable=False)
+
+            response = self._get_thread_service().files().create(body=file_metadata, media_body=media, fields="id", supportsAllDrives=True).execute()
+
+            file_id = response.get("id")
+            if file_id:
+                return str(file_id)
+            else:
+                raise FileUploadError("アップロード後のIDが取得できませんでした", file_name)
+
+        except FileUploadError:
+            raise
+        except Exception as e:
+            raise FileUploadError(f"ファイルのアップロードに失敗しました: {e!s}", file_name) from e
+
+    def delete_file(self, file_id: str) -> None:
+        """Google Drive上のファイルを削除
+
+        Args:
+            file_id: 削除するファイルのID
+
+        Raises:
+            GoogleDriveError: 削除に失敗した場合
+
+        """
+        try:
+            self.service.files().delete(fileId=file_id, supportsAllDrives=True).execute()
+        except Exception as e:
+            raise GoogleDriveError(f"ファイルの削除に失敗しました: {e!s}") from e
+
     def list_folders(self, folder_url: str) -> list[DriveFile]:
         """フォルダ内のサブフォルダ一覧を取得"""
         try:
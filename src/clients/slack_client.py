@@ -2,12 +2,16 @@
 
 import datetime
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 from zoneinfo import ZoneInfo
 
 import requests
 
+# 日時の記録に使用するタイムゾーン（日本時間）
+JST = ZoneInfo("Asia/Tokyo")
+
 
 @dataclass
 class ProcessResult:
@@ -60,12 +64,13 @@ class SlackClient:
 
     """
 
-    def __init__(self, webhook_url: str, timeout: int = 30) -> None:
+    def __init__(self, webhook_url: str, timeout: int = 30, sleep_fn: Callable[[float], None] | None = None) -> None:
         """SlackClientを初期化
 
         Args:
             webhook_url: Slack WebHook URL
             timeout: HTTP通信のタイムアウト時間（秒）
+            sleep_fn: リトライ待機に使う関数（省略時はtime.sleep、テストでは待機を省略する関数を渡せる）
 
         Raises:
             ValueError: WebHook URLが無効な場合
@@ -80,6 +85,7 @@ class SlackClient:
 
         self.webhook_url = webhook_url
         self.timeout = timeout
+        self._sleep = sleep_fn or time.sleep
 
     def send_process_notification(self, result: ProcessResult) -> None:
         """処理完了通知を送信
@@ -96,7 +102,7 @@ class SlackClient:
 
         # タイムスタンプが指定されていない場合は現在時刻を使用
         if not result.timestamp:
-            result.timestamp = datetime.datetime.now(tz=ZoneInfo("Asia/Tokyo")).strftime("%Y-%m-%d %H:%M:%S")
+            result.timestamp = datetime.datetime.now(tz=JST).strftime("%Y-%m-%d %H:%M:%S")
 
         payload = self._build_process_notification_message(result)
         self._call_webhook_api(payload)
@@ -186,7 +192,7 @@ class SlackClient:
                 if response.status_code == 429:  # Rate Limit
                     retry_after = int(response.headers.get("Retry-After", 60))
                     if attempt < max_retries - 1:
-                        time.sleep(retry_after)
+                        self._sleep(retry_after)
                         continue
 
                 raise SlackWebHookError(f"Slack WebHook API呼び出しに失敗しました: {response.status_code} - {response.text}", status_code=response.status_code)
@@ -195,7 +201,7 @@ class SlackClient:
                 last_exception = e
 
                 if attempt < max_retries - 1:
-                    time.sleep(2**attempt)  # 指数バックオフ
+                    self._sleep(2**attempt)  # 指数バックオフ
                     continue
 
         raise SlackWebHookError(f"Slack WebHook API呼び出しが{max_retries}回失敗しました: {last_exception!s}")
@@ -9,12 +9,13 @@ import click
 from dotenv import load_dotenv
 
 from src.builders.prompt_builder import PromptBuilder
-from src.clients.chatgpt_client import ChatGPTClient
+from src.clients.chatgpt_client import BATCH_MAX_WAIT_SECONDS, ChatGPTClient
 from src.clients.google_drive_client import GoogleDriveClient
 from src.clients.slack_client import SlackClient
 from src.clients.whisper_client import WhisperClient
 from src.models.result import GenerateResult
 from src.service.draft_generator import DraftGenerator
+from src.service.llm_cache import LLMCache
 from src.service.srt_generator import SrtGenerator
 from src.usecases.google_drive_batch_process_usecase import GoogleDriveBatchProcessUsecase
 from src.usecases.transcript_to_draft_usecase import TranscriptToDraftUsecase
@@ -33,6 +34,8 @@ class DIContainer:
         self.openai_api_key = self._get_required_env("OPENAI_API_KEY")
         self.chatgpt_model = os.getenv("CHATGPT_MODEL", "gpt-4o")
         self.whisper_model = os.getenv("WHISPER_MODEL", "whisper-1")
+        self.chatgpt_max_concurrency = int(os.getenv("CHATGPT_MAX_CONCURRENCY", "10"))
+        self.chatgpt_batch_max_wait_seconds = float(os.getenv("CHATGPT_BATCH_MAX_WAIT_SECONDS", str(BATCH_MAX_WAIT_SECONDS)))
 
         # Google Drive API設定（サービスアカウント）
         # Cloud Runではオプショナル、ローカルでは必須
@@ -49,9 +52,20 @@ class DIContainer:
         self.slack_webhook_url = os.getenv("SLACK_WEBHOOK_URL")
         self.slack_notifications_enabled = os.getenv("SLACK_NOTIFICATIONS_ENABLED", "false").lower() == "true"
 
+        # バッチ処理の一時ディレクトリを/dev/shm（tmpfs）に作成するか（オプショナル）
+        self.use_tmpfs = os.getenv("SHORTMOVIE_TMPFS", "false").lower() in {"1", "true"}
+
+        # LLM応答キャッシュ設定（指定時のみ有効）
+        self.llm_cache_dir = os.getenv("LLM_CACHE_DIR")
+
         self.whisper_client = WhisperClient(api_key=self.openai_api_key, model=self.whisper_model)
 
-        self.chatgpt_client = ChatGPTClient(api_key=self.openai_api_key, model=self.chatgpt_model)
+        self.chatgpt_client = ChatGPTClient(
+            api_key=self.openai_api_key,
+            model=self.chatgpt_model,
+            max_concurrency=self.chatgpt_max_concurrency,
+            batch_max_wait_seconds=self.chatgpt_batch_max_wait_seconds,
+        )
 
         # Cloud Runでの実行時はADCを使用、ローカルではキーファイルまたはJSON文字列を使用
         self.google_drive_client = GoogleDriveClient(
@@ -78,8 +92,10 @@ class DIContainer:
         # 新しいUsecaseの初期化
         self.video_to_transcript_usecase = VideoToTranscriptUsecase(whisper_client=self.whisper_client)
 
+        self.llm_cache = LLMCache(self.llm_cache_dir) if self.llm_cache_dir else None
+
         self.transcript_to_draft_usecase = TranscriptToDraftUsecase(
-            chatgpt_client=self.chatgpt_client, prompt_builder=self.prompt_builder, srt_generator=self.srt_generator
+            chatgpt_client=self.chatgpt_client, prompt_builder=self.prompt_builder, srt_generator=self.srt_generator, llm_cache=self.llm_cache
         )
 
         # リファクタリング後のGoogleDriveBatchProcessUsecase（Slack通知対応）
@@ -88,6 +104,7 @@ class DIContainer:
             transcript_to_draft_usecase=self.transcript_to_draft_usecase,
             google_drive_client=self.google_drive_client,
             slack_client=self.slack_client,  # 新規追加
+            use_tmpfs=self.use_tmpfs,
         )
 
     def _get_required_env(self, key: str) -> str:
@@ -137,6 +154,7 @@ class DIContainer:
 @click.option("--drive", is_flag=True, help="Google DriveフォルダURLとして処理")
 @click.option("--upload", is_flag=True, help="生成されたファイルをGoogle Driveにアップロードする")
 @click.option("--upload-folder-id", help="アップロード先のGoogle DriveフォルダID")
+@click.option("--openai-batch", is_flag=True, help="企画書生成にOpenAI Batch APIを使用する（料金は半額、完了まで最大24時間）")
 def main(
     input_source: str,
     output_dir: Path,
@@ -148,6 +166,7 @@ def main(
     drive: bool,
     upload: bool,
     upload_folder_id: str,
+    openai_batch: bool,
 ) -> None:
     """動画ファイルまたはGoogle Driveフォルダからショート動画企画書を生成
 
@@ -157,6 +176,8 @@ def main(
     例:
         poetry run python src/main.py input/video.mp4 output/
 
+        poetry run python src/main.py input/video.mp4 output/ --openai-batch
+
         poetry run python src/main.py "https://drive.google.com/drive/folders/abc123?usp=sharing" output/ --drive
 
         poetry run python src/main.py --drive-batch --input-drive-folder "https://drive.google.com/..." --output-drive-folder "https://drive.google.com/..."
@@ -253,7 +274,9 @@ def main(
                 click.echo(f"✓ 文字起こし完了: {transcript_result.transcript_file_path}")
                 click.echo("📝 企画書生成を開始します...")
 
-            draft_result = container.transcript_to_draft_usecase.execute(transcript_result.transcript_file_path, str(output_dir))
+            draft_result = container.transcript_to_draft_usecase.execute(
+                transcript_result.transcript_file_path, str(output_dir), mode="batch" if openai_batch else "sync"
+            )
             if not draft_result.success:
                 click.echo(f"❌ 企画書生成処理中にエラーが発生しました: {draft_result.error_message}", err=True)
                 sys.exit(1)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .transcription import TranscriptionResult
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShortVideoProposal:
     """ショート動画の企画提案
 
@@ -32,7 +32,7 @@ class ShortVideoProposal:
     key_points: list[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DraftResult:
     """企画書生成結果
 
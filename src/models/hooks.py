@@ -1,11 +1,12 @@
 """フック関連のデータ構造"""
 
 from dataclasses import dataclass
+from typing import Any
 
 from .transcription import TranscriptionResult, TranscriptionSegment
 
 
-@dataclass
+@dataclass(slots=True)
 class HookItem:
     """フック抽出結果の単一アイテム
 
@@ -32,6 +33,11 @@ class HookItem:
     third_hook: str
     summary: str
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HookItem":
+        """辞書（APIレスポンスのアイテムやキャッシュ）からHookItemを生成"""
+        return cls(first_hook=data["first_hook"], second_hook=data["second_hook"], third_hook=data["third_hook"], summary=data["summary"])
+
 
 @dataclass
 class HooksExtractionResult:
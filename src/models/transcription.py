@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionSegment:
     """文字起こしの個別セグメント
 
@@ -24,7 +24,7 @@ class TranscriptionSegment:
     text: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionResult:
     """文字起こし結果の全体
 
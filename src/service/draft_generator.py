@@ -1,9 +1,10 @@
 """企画書生成サービス"""
 
-import json
 import os
 from pathlib import Path
 
+import orjson
+
 from ..builders.prompt_builder import PromptBuilder
 from ..clients.chatgpt_client import ChatGPTClient
 from ..clients.whisper_client import WhisperClient
@@ -168,8 +169,8 @@ class DraftGenerator:
             raise FileNotFoundError(f"文字起こしファイルが見つかりません: {transcription_file}")
 
         try:
-            with open(transcription_file, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(transcription_file, "rb") as f:
+                data = orjson.loads(f.read())
 
             return self._deserialize_transcription(data)
 
@@ -199,8 +200,8 @@ class DraftGenerator:
 
         data = self._serialize_transcription(transcription)
 
-        with open(transcription_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # orjsonは非ASCII文字をエスケープせずUTF-8で出力する
+        transcription_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         return str(transcription_file)
 
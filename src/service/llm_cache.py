@@ -0,0 +1,85 @@
+"""LLM応答のディスクキャッシュサービス"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+class LLMCache:
+    """LLM応答のディスクキャッシュ
+
+    プロンプト等の入力内容から計算したSHA-256をキーとして、応答をJSONファイルに保存します。
+    同じ文字起こしを再処理する場合（再実行・プロンプト調整時の検証など）にAPI呼び出しを省略できます。
+
+    Example:
+        >>> cache = LLMCache("intermediate/.llm_cache")
+        >>> key = cache.make_key(phase="hooks", model="gpt-4o", prompt="...")
+        >>> if cache.get(key) is None:
+        ...     cache.set(key, {"items": []})
+
+    """
+
+    def __init__(self, cache_dir: str):
+        """LLMCacheを初期化
+
+        Args:
+            cache_dir: キャッシュファイルの保存先ディレクトリ
+
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def make_key(self, **parts: Any) -> str:
+        """キャッシュキーを生成
+
+        Args:
+            **parts: キーの元になる値（JSONシリアライズ可能な値）
+
+        Returns:
+            SHA-256の16進文字列
+
+        """
+        serialized = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """キャッシュされた値を取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュされた値、存在しない・読み込めない場合はNone
+
+        """
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"DEBUG: LLMキャッシュの読み込みに失敗しました: {cache_file} ({e})")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """値をキャッシュに保存
+
+        書き込み途中のファイルが読まれないよう、一時ファイルに書き込んでからリネームする。
+        保存に失敗しても処理は止めない。
+
+        Args:
+            key: キャッシュキー
+            value: 保存する値（JSONシリアライズ可能な値）
+
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                json.dump(value, f, ensure_ascii=False)
+                temp_path = f.name
+            os.replace(temp_path, self.cache_dir / f"{key}.json")
+        except Exception as e:
+            print(f"DEBUG: LLMキャッシュの保存に失敗しました: {e}")
@@ -4,6 +4,9 @@ import os
 
 from ..models.transcription import TranscriptionResult
 
+# SRTの1ブロック（番号、時刻範囲、テキスト）。ブロック同士は空行で区切る
+SRT_BLOCK_TEMPLATE = "%d\n%s --> %s\n%s\n"
+
 
 class SrtGenerationError(Exception):
     """SRT生成関連のエラー"""
@@ -67,22 +70,12 @@ class SrtGenerator:
             SRT形式の文字列
 
         """
-        srt_lines = []
-
-        for i, segment in enumerate(transcription.segments, 1):
-            start_time = self.format_seconds_to_srt_time(segment.start_time)
-            end_time = self.format_seconds_to_srt_time(segment.end_time)
-
-            srt_lines.extend(
-                [
-                    str(i),
-                    f"{start_time} --> {end_time}",
-                    segment.text,
-                    "",
-                ],
-            )
-
-        return "\n".join(srt_lines)
+        format_time = self.format_seconds_to_srt_time
+        srt_blocks = [
+            SRT_BLOCK_TEMPLATE % (i, format_time(segment.start_time), format_time(segment.end_time), segment.text)
+            for i, segment in enumerate(transcription.segments, 1)
+        ]
+        return "\n".join(srt_blocks)
 
     def format_seconds_to_srt_time(self, seconds: float) -> str:
         """秒数をSRT形式の時刻に変換
@@ -94,8 +87,9 @@ class SrtGenerator:
             SRT形式の時刻文字列（hh:mm:ss,mmm）
 
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
+        # 浮動小数点の剰余を重ねると誤差で1ミリ秒ずれるため、ミリ秒の整数に丸めてから分解する
+        total_milliseconds = round(seconds * 1000)
+        hours, remainder = divmod(total_milliseconds, 3_600_000)
+        minutes, remainder = divmod(remainder, 60_000)
+        secs, milliseconds = divmod(remainder, 1000)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
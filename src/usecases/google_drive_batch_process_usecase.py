@@ -1,7 +1,12 @@
 """Google Drive間バッチ処理ユースケース（リファクタリング版）"""
 
+import os
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 from ..clients.google_drive_client import GoogleDriveClient, GoogleDriveError
 from ..clients.slack_client import SlackClient
@@ -10,6 +15,21 @@ from ..models.result import GoogleDriveBatchResult
 from .transcript_to_draft_usecase import TranscriptToDraftUsecase
 from .video_to_transcript_usecase import VideoToTranscriptUsecase
 
+# 日時の記録に使用するタイムゾーン（日本時間）
+JST = ZoneInfo("Asia/Tokyo")
+
+# tmpfs（RAM上のファイルシステム）のマウント先
+TMPFS_DIR = "/dev/shm"
+
+# 処理中の出力サブフォルダに配置するマーカーファイル名
+PROCESSING_MARKER_NAME = ".processing"
+
+# 並列アップロードの最大数（企画書・字幕・動画・文字起こしの4ファイル）
+UPLOAD_MAX_WORKERS = 4
+
+# この秒数より古い処理中マーカーは、クラッシュした実行の残骸とみなす（Cloud Run Jobのタイムアウトと同じ）
+PROCESSING_MARKER_TIMEOUT_SECONDS = 3600
+
 
 class GoogleDriveBatchProcessUsecase:
     """Google Drive間バッチ処理ユースケース（リファクタリング版）
@@ -27,11 +47,28 @@ class GoogleDriveBatchProcessUsecase:
         transcript_to_draft_usecase: TranscriptToDraftUsecase,
         google_drive_client: GoogleDriveClient,
         slack_client: SlackClient | None = None,
+        use_tmpfs: bool = False,
     ):
+        """GoogleDriveBatchProcessUsecaseを初期化
+
+        Args:
+            video_to_transcript_usecase: 動画→文字起こしユースケース
+            transcript_to_draft_usecase: 文字起こし→企画書ユースケース
+            google_drive_client: Google Driveクライアント
+            slack_client: Slackクライアント（省略時は通知しない）
+            use_tmpfs: 一時ディレクトリを/dev/shm（tmpfs）に作成するか
+                動画サイズの2倍の空き容量がある場合のみ使用する。tmpfsはメモリを消費するため、
+                動画サイズの約2倍のRAMが必要になる
+
+        """
         self.video_to_transcript_usecase = video_to_transcript_usecase
         self.transcript_to_draft_usecase = transcript_to_draft_usecase
         self.google_drive_client = google_drive_client
         self.slack_client = slack_client
+        self.use_tmpfs = use_tmpfs
+
+        # ワーカースレッドごとにキャッシュされるDrive APIサービスを使い回すため、実行ごとではなく1回だけ作成する
+        self._upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="drive-upload")
 
     def execute_drive_batch(self, input_folder_url: str, output_folder_url: str) -> GoogleDriveBatchResult:
         """Google Drive間でのバッチ処理実行（リファクタリング版）
@@ -57,52 +94,54 @@ class GoogleDriveBatchProcessUsecase:
             # 3. 出力フォルダの準備（既存ロジック維持）
             video_name = Path(unprocessed_video.name).stem
             output_folder_id = self.google_drive_client.extract_folder_id(output_folder_url)
+            # 処理中マーカーも同時に配置する（クラッシュ時は次回以降の実行で再処理される）
             output_subfolder_id = self._prepare_output_subfolder(output_folder_id, video_name)
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # 3. 動画ダウンロード
-                video_path = self.google_drive_client.download_file(unprocessed_video, temp_dir)
-
-                # 4. Phase 1: 動画→文字起こし
-                transcript_result = self.video_to_transcript_usecase.execute(video_path, temp_dir)
-
-                if not transcript_result.success:
-                    error_msg = transcript_result.error_message or "文字起こし処理に失敗しました"
-                    self._send_processing_failure_notification(unprocessed_video.name, error_msg)
-                    return GoogleDriveBatchResult.from_error(error_msg)
-
-                # 5. Phase 2: 文字起こし→企画書
-                draft_result = self.transcript_to_draft_usecase.execute(transcript_result.transcript_file_path, temp_dir)
-
-                if not draft_result.success:
-                    error_msg = draft_result.error_message or "企画書生成処理に失敗しました"
-                    self._send_processing_failure_notification(unprocessed_video.name, error_msg)
-                    return GoogleDriveBatchResult.from_error(error_msg)
-
-                # 6. 結果ファイルのアップロード
-                draft_url = self.google_drive_client.upload_file(draft_result.draft_file_path, output_subfolder_id)
-                subtitle_url = self.google_drive_client.upload_file(draft_result.subtitle_file_path, output_subfolder_id)
-                video_url = self.google_drive_client.upload_file(video_path, output_subfolder_id)
-
-                # 7. 中間ファイル（transcript.json）もアップロード（デバッグ用）
-                transcript_url = self.google_drive_client.upload_file(transcript_result.transcript_file_path, output_subfolder_id)
-
-                # 8. 出力サブフォルダのURLを生成
-                output_subfolder_url = f"https://drive.google.com/drive/folders/{output_subfolder_id}"
-
-                # 9. 処理完了通知
-                self._send_processing_success_notification(unprocessed_video.name, output_subfolder_url)
-
-                return GoogleDriveBatchResult(
-                    success=True,
-                    processed_video=unprocessed_video.name,
-                    output_folder_id=output_subfolder_id,
-                    draft_url=draft_url,
-                    subtitle_url=subtitle_url,
-                    video_url=video_url,
-                    transcript_url=transcript_url,  # 新規追加
-                    message=f"動画 '{unprocessed_video.name}' の処理が完了しました",
-                )
+            try:
+                with tempfile.TemporaryDirectory(dir=self._select_temp_dir_base(unprocessed_video)) as temp_dir:
+                    # 3. 動画ダウンロード
+                    video_path = self.google_drive_client.download_file(unprocessed_video, temp_dir)
+
+                    # 4. Phase 1: 動画→文字起こし
+                    transcript_result = self.video_to_transcript_usecase.execute(video_path, temp_dir)
+
+                    if not transcript_result.success:
+                        error_msg = transcript_result.error_message or "文字起こし処理に失敗しました"
+                        self._send_processing_failure_notification(unprocessed_video.name, error_msg)
+                        return GoogleDriveBatchResult.from_error(error_msg)
+
+                    # 5. Phase 2: 文字起こし→企画書
+                    draft_result = self.transcript_to_draft_usecase.execute(transcript_result.transcript_file_path, temp_dir)
+
+                    if not draft_result.success:
+                        error_msg = draft_result.error_message or "企画書生成処理に失敗しました"
+                        self._send_processing_failure_notification(unprocessed_video.name, error_msg)
+                        return GoogleDriveBatchResult.from_error(error_msg)
+
+                    # 6. 結果ファイルと中間ファイル（transcript.json、デバッグ用）を並列アップロード
+                    draft_url, subtitle_url, video_url, transcript_url = self._upload_files(
+                        [draft_result.draft_file_path, draft_result.subtitle_file_path, video_path, transcript_result.transcript_file_path],
+                        output_subfolder_id,
+                    )
+
+                    # 7. 出力サブフォルダのURLを生成
+                    output_subfolder_url = f"https://drive.google.com/drive/folders/{output_subfolder_id}"
+
+                    # 8. 処理完了通知
+                    self._send_processing_success_notification(unprocessed_video.name, output_subfolder_url)
+
+                    return GoogleDriveBatchResult(
+                        success=True,
+                        processed_video=unprocessed_video.name,
+                        output_folder_id=output_subfolder_id,
+                        draft_url=draft_url,
+                        subtitle_url=subtitle_url,
+                        video_url=video_url,
+                        transcript_url=transcript_url,  # 新規追加
+                        message=f"動画 '{unprocessed_video.name}' の処理が完了しました",
+                    )
+            finally:
+                self._release_output_subfolder(output_subfolder_id)
 
         except Exception as e:
             error_msg = str(e)
@@ -112,7 +151,10 @@ class GoogleDriveBatchProcessUsecase:
             return GoogleDriveBatchResult.from_error(error_msg)
 
     def _prepare_output_subfolder(self, output_folder_id: str, video_name: str) -> str:
-        """出力サブフォルダの準備（既存ロジックを分離）
+        """出力サブフォルダの準備と処理中マーカーの配置
+
+        マーカーのないサブフォルダは処理済みとみなされるため、新規作成したフォルダにはすぐにマーカーを配置し、
+        配置できなかった場合はフォルダを削除して次回以降の実行で再処理されるようにする。
 
         Args:
             output_folder_id: 出力フォルダID
@@ -122,12 +164,122 @@ class GoogleDriveBatchProcessUsecase:
             出力サブフォルダID
 
         """
-        if not self.google_drive_client.folder_exists(output_folder_id, video_name):
-            return self.google_drive_client.create_folder(video_name, output_folder_id)
-        else:
-            query = f"'{output_folder_id}' in parents and name='{video_name}' and mimeType='application/vnd.google-apps.folder'"
-            results = self.google_drive_client.service.files().list(q=query, fields="files(id)", supportsAllDrives=True).execute()
-            return str(results["files"][0]["id"])
+        output_subfolder_id = self.google_drive_client.find_folder_id(output_folder_id, video_name)
+        if output_subfolder_id:
+            self._reserve_output_subfolder(output_subfolder_id)
+            return output_subfolder_id
+
+        output_subfolder_id = self.google_drive_client.create_folder(video_name, output_folder_id)
+        try:
+            self.google_drive_client.upload_bytes(b"", output_subfolder_id, PROCESSING_MARKER_NAME)
+        except Exception:
+            try:
+                self.google_drive_client.delete_file(output_subfolder_id)
+            except Exception as e:
+                print(f"DEBUG: 出力サブフォルダの削除に失敗しました: {e}")
+            raise
+
+        return output_subfolder_id
+
+    def _reserve_output_subfolder(self, output_subfolder_id: str) -> None:
+        """既存の出力サブフォルダに処理中マーカーを配置
+
+        クラッシュした実行の古いマーカーが残っている場合は置き換える。
+
+        Args:
+            output_subfolder_id: 出力サブフォルダID
+
+        """
+        for marker in self.google_drive_client.find_files_by_name(output_subfolder_id, PROCESSING_MARKER_NAME):
+            self.google_drive_client.delete_file(marker["id"])
+
+        self.google_drive_client.upload_bytes(b"", output_subfolder_id, PROCESSING_MARKER_NAME)
+
+    def _release_output_subfolder(self, output_subfolder_id: str) -> None:
+        """出力サブフォルダの処理中マーカーを削除
+
+        Args:
+            output_subfolder_id: 出力サブフォルダID
+
+        """
+        try:
+            for marker in self.google_drive_client.find_files_by_name(output_subfolder_id, PROCESSING_MARKER_NAME):
+                self.google_drive_client.delete_file(marker["id"])
+        except Exception as e:
+            # マーカーが残っても次回以降に再処理されるだけなので処理は止めない
+            print(f"DEBUG: 処理中マーカーの削除に失敗しました: {e}")
+
+    def _is_abandoned_output_subfolder(self, output_subfolder_id: str) -> bool:
+        """出力サブフォルダがクラッシュした実行により処理途中で放置されているかを判定
+
+        処理中マーカーがあり、かつタイムアウトを超えて古い場合のみ放置とみなす。
+        タイムアウト以内のマーカーは別の実行が処理中の可能性があるため対象外とする。
+
+        Args:
+            output_subfolder_id: 出力サブフォルダID
+
+        Returns:
+            放置されている場合はTrue
+
+        """
+        markers = self.google_drive_client.find_files_by_name(output_subfolder_id, PROCESSING_MARKER_NAME)
+        if not markers:
+            return False
+
+        created_at = max(self._parse_drive_timestamp(marker["createdTime"]) for marker in markers)
+        return datetime.now(JST) - created_at > timedelta(seconds=PROCESSING_MARKER_TIMEOUT_SECONDS)
+
+    def _parse_drive_timestamp(self, value: str) -> datetime:
+        """Google DriveのRFC 3339形式の日時文字列（例: 2025-01-01T00:00:00.000Z）を解析
+
+        Python 3.10のdatetime.fromisoformatは末尾の「Z」を解釈できないため、UTCオフセットに置き換えてから解析する。
+
+        Args:
+            value: Google Driveが返す日時文字列
+
+        Returns:
+            タイムゾーン付きのdatetime
+
+        """
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+    def _upload_files(self, file_paths: list[str], folder_id: str) -> list[str]:
+        """複数ファイルを並列でGoogle Driveにアップロード
+
+        Args:
+            file_paths: アップロード対象のファイルパスのリスト
+            folder_id: アップロード先のフォルダID
+
+        Returns:
+            アップロードされたファイルのURLのリスト（file_pathsと同じ順序）
+
+        Raises:
+            FileUploadError: いずれかのアップロードに失敗した場合
+
+        """
+        return list(self._upload_executor.map(lambda path: self.google_drive_client.upload_file(path, folder_id), file_paths))
+
+    def _select_temp_dir_base(self, video_file: DriveFile) -> str | None:
+        """一時ディレクトリの作成先を選択
+
+        Args:
+            video_file: 処理対象の動画ファイル
+
+        Returns:
+            tmpfsを使用する場合はそのパス、それ以外はNone（システムのデフォルト）
+
+        """
+        if not self.use_tmpfs or not video_file.size or not os.path.isdir(TMPFS_DIR):
+            return None
+
+        # 動画本体に加えて中間ファイル等の余裕を見て、動画サイズの2倍の空きを要求する
+        if shutil.disk_usage(TMPFS_DIR).free <= 2 * video_file.size:
+            print(f"DEBUG: {TMPFS_DIR}の空き容量が不足しているため、デフォルトの一時ディレクトリを使用します")
+            return None
+
+        return TMPFS_DIR
 
     def _find_unprocessed_video_from_drive(self, input_folder_url: str, output_folder_url: str) -> DriveFile | None:
         """Google Driveフォルダから未処理動画を1本検出
@@ -138,6 +290,7 @@ class GoogleDriveBatchProcessUsecase:
         1. 入力フォルダから動画ファイル一覧を取得
         2. ファイル名順でソート（安定した処理順序）
         3. 出力フォルダ内に同名サブフォルダが存在しない動画を検索
+           （サブフォルダがあっても、古い処理中マーカーが残っていればクラッシュした実行の残骸として再処理対象とする）
         4. 最初に見つかった未処理動画を返す
         """
         try:
@@ -154,7 +307,12 @@ class GoogleDriveBatchProcessUsecase:
             for video_file in video_files:
                 video_name = Path(video_file.name).stem
 
-                if not self.google_drive_client.folder_exists(output_folder_id, video_name):
+                output_subfolder_id = self.google_drive_client.find_folder_id(output_folder_id, video_name)
+                if not output_subfolder_id:
+                    return video_file
+
+                if self._is_abandoned_output_subfolder(output_subfolder_id):
+                    print(f"DEBUG: 処理途中で中断された動画を再処理します: {video_file.name}")
                     return video_file
 
             return None
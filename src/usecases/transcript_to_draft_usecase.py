@@ -1,18 +1,31 @@
 """文字起こし→企画書ユースケース（2段階処理版）"""
 
-import json
 import os
+import stat
+import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, astuple
 from datetime import datetime
 from pathlib import Path
+from typing import Literal
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from ..builders.prompt_builder import PromptBuilder
 from ..clients.chatgpt_client import ChatGPTClient
-from ..models.hooks import DetailedScript, HooksExtractionResult
+from ..models.hooks import DetailedScript, HookItem, HooksExtractionResult
 from ..models.transcription import TranscriptionResult, TranscriptionSegment
 from ..models.usecase_results import TranscriptToDraftResult
+from ..service.llm_cache import LLMCache
 from ..service.srt_generator import SrtGenerator
 
+# 日時の記録に使用するタイムゾーン（日本時間）
+JST = ZoneInfo("Asia/Tokyo")
+
+# 読み込みを許可するtranscript.jsonの最大サイズ（破損・巨大ファイルによるメモリ枯渇を防ぐ）
+MAX_TRANSCRIPT_BYTES = 200 * 1024 * 1024
+
 
 class TranscriptToDraftUsecaseError(Exception):
     """TranscriptToDraftUsecase関連のベース例外"""
@@ -68,25 +81,30 @@ class TranscriptToDraftUsecase:
 
     """
 
-    def __init__(self, chatgpt_client: ChatGPTClient, prompt_builder: PromptBuilder, srt_generator: SrtGenerator):
+    def __init__(self, chatgpt_client: ChatGPTClient, prompt_builder: PromptBuilder, srt_generator: SrtGenerator, llm_cache: LLMCache | None = None):
         """TranscriptToDraftUsecaseを初期化
 
         Args:
             chatgpt_client: ChatGPT APIクライアント
             prompt_builder: プロンプト生成器
             srt_generator: SRT字幕ファイル生成器
+            llm_cache: LLM応答キャッシュ（省略時はキャッシュしない）
 
         """
         self.chatgpt_client = chatgpt_client
         self.prompt_builder = prompt_builder
         self.srt_generator = srt_generator
+        self.llm_cache = llm_cache
 
-    def execute(self, transcript_file_path: str, output_dir: str) -> TranscriptToDraftResult:
+    def execute(self, transcript_file_path: str, output_dir: str, mode: Literal["sync", "batch"] = "sync") -> TranscriptToDraftResult:
         """2段階処理による企画書と字幕ファイルの生成
 
         Args:
             transcript_file_path: 文字起こしJSONファイルのパス
             output_dir: 出力ディレクトリのパス
+            mode: ChatGPT APIの呼び出し方法
+                "sync": 通常のAPIで即時に生成する
+                "batch": Batch APIで生成する（料金は半額だが、完了まで最大24時間かかる）
 
         Returns:
             処理結果（TranscriptToDraftResult）
@@ -98,18 +116,50 @@ class TranscriptToDraftUsecase:
             self._prepare_output_directory(output_dir)
             transcription = self._load_transcript(transcript_file_path)
 
-            # 2. フェーズ1: フック抽出
-            hooks_result = self._extract_hooks_phase(transcription)
+            # 字幕は文字起こしだけから生成できるため、LLM処理と並行して生成する
+            subtitle_file_path = self._get_subtitle_file_path(transcript_file_path, output_dir)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                subtitle_future = executor.submit(self._generate_subtitle_file, transcription, subtitle_file_path)
+
+                try:
+                    # 2. フェーズ1: フック抽出
+                    hooks_result = self._extract_hooks_phase(transcription, mode)
+
+                    # 字幕の生成に失敗していれば、API呼び出しの多い台本生成の前に中断する
+                    generated_subtitle_file_path = subtitle_future.result()
 
-            # 3. フェーズ2: 詳細台本作成（並列）
-            detailed_scripts = self._generate_scripts_phase(hooks_result)
+                    # 3. フェーズ2: 詳細台本作成（並列）
+                    detailed_scripts = self._generate_scripts_phase(hooks_result, mode)
 
-            # 4. 結果統合・ファイル出力
-            return self._generate_output_files(hooks_result, detailed_scripts, transcript_file_path, output_dir)
+                    # 4. 結果統合・ファイル出力
+                    return self._generate_output_files(hooks_result, detailed_scripts, transcript_file_path, output_dir, generated_subtitle_file_path)
+
+                except Exception:
+                    # 企画書を出力できなかった場合は、生成中・生成済みの字幕ファイルを残さない
+                    self._discard_subtitle_file(subtitle_future, subtitle_file_path)
+                    raise
 
         except Exception as e:
             return TranscriptToDraftResult(success=False, draft_file_path="", subtitle_file_path="", error_message=str(e))
 
+    def _discard_subtitle_file(self, subtitle_future: Future[str], subtitle_file_path: str) -> None:
+        """処理失敗時に字幕ファイルを削除
+
+        生成途中の場合は完了を待ってから削除し、企画書のない字幕ファイル（書きかけを含む）が残らないようにする。
+
+        Args:
+            subtitle_future: 字幕ファイル生成のFuture
+            subtitle_file_path: 字幕ファイルのパス
+
+        """
+        if not subtitle_future.cancel():
+            wait([subtitle_future])
+
+        try:
+            Path(subtitle_file_path).unlink(missing_ok=True)
+        except OSError as e:
+            print(f"DEBUG: 字幕ファイルの削除に失敗しました: {e}")
+
     def _validate_input(self, transcript_file_path: str, output_dir: str) -> None:
         """入力パラメータの検証
 
@@ -124,10 +174,13 @@ class TranscriptToDraftUsecase:
         if not transcript_file_path or not transcript_file_path.strip():
             raise TranscriptInputValidationError("文字起こしファイルパスが指定されていません", "transcript_file_path")
 
-        if not os.path.exists(transcript_file_path):
-            raise TranscriptInputValidationError(f"文字起こしファイルが存在しません: {transcript_file_path}", "transcript_file_path")
+        # 存在確認とファイル種別の確認を1回のstatで行う
+        try:
+            file_stat = os.stat(transcript_file_path)
+        except OSError as e:
+            raise TranscriptInputValidationError(f"文字起こしファイルが存在しません: {transcript_file_path}", "transcript_file_path") from e
 
-        if not os.path.isfile(transcript_file_path):
+        if not stat.S_ISREG(file_stat.st_mode):
             raise TranscriptInputValidationError(f"指定されたパスはファイルではありません: {transcript_file_path}", "transcript_file_path")
 
         if not output_dir or not output_dir.strip():
@@ -167,8 +220,12 @@ class TranscriptToDraftUsecase:
 
         """
         try:
-            with open(transcript_file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            size = os.path.getsize(transcript_file_path)
+            if size > MAX_TRANSCRIPT_BYTES:
+                raise DraftGenerationError(f"文字起こしファイルが大きすぎます: {size} bytes（上限: {MAX_TRANSCRIPT_BYTES} bytes）", transcript_file_path)
+
+            with open(transcript_file_path, "rb") as f:
+                data = orjson.loads(f.read())
 
             # JSONデータからTranscriptionResultオブジェクトを復元
             return self._deserialize_transcription(data)
@@ -190,27 +247,34 @@ class TranscriptToDraftUsecase:
 
         """
         try:
+            segments_data = data["segments"]
+            if not isinstance(segments_data, list):
+                raise DraftGenerationError(f"文字起こしファイルの形式が無効です。segmentsがリストではありません: {type(segments_data).__name__}")
+
             segments = [
                 TranscriptionSegment(
                     start_time=segment_data["start_time"],
                     end_time=segment_data["end_time"],
                     text=segment_data["text"],
                 )
-                for segment_data in data["segments"]
+                for segment_data in segments_data
             ]
 
             return TranscriptionResult(segments=segments, full_text=data["full_text"])
 
+        except DraftGenerationError:
+            raise
         except KeyError as e:
             raise DraftGenerationError(f"文字起こしファイルの形式が無効です。必要なフィールドが見つかりません: {e}") from e
         except Exception as e:
             raise DraftGenerationError(f"文字起こしデータの復元に失敗しました: {e!s}") from e
 
-    def _extract_hooks_phase(self, transcription: TranscriptionResult) -> HooksExtractionResult:
+    def _extract_hooks_phase(self, transcription: TranscriptionResult, mode: Literal["sync", "batch"] = "sync") -> HooksExtractionResult:
         """フェーズ1: フック抽出
 
         Args:
             transcription: 文字起こし結果
+            mode: ChatGPT APIの呼び出し方法（"sync" または "batch"）
 
         Returns:
             フック抽出結果
@@ -223,19 +287,39 @@ class TranscriptToDraftUsecase:
             # フック抽出用プロンプトを構築
             hooks_prompt = self.prompt_builder.build_hooks_prompt(transcription)
 
+            # キャッシュがあればAPI呼び出しを省略
+            cache_key = None
+            if self.llm_cache:
+                cache_key = self.llm_cache.make_key(phase="hooks", model=self.chatgpt_client.model, prompt=hooks_prompt)
+                cached_items = self.llm_cache.get(cache_key)
+                if cached_items is not None:
+                    try:
+                        items = [HookItem.from_dict(item) for item in cached_items]
+                    except (KeyError, TypeError) as e:
+                        # 形式が不正なキャッシュはキャッシュミスとして扱い、APIを呼び出して上書きする
+                        print(f"DEBUG: フック抽出結果のキャッシュが不正なため無視します: {e}")
+                    else:
+                        print("DEBUG: フック抽出結果をキャッシュから読み込みました")
+                        return HooksExtractionResult(items=self._deduplicate_hook_items(items), original_transcription=transcription)
+
             # ChatGPT APIでフック抽出
-            hook_items = self.chatgpt_client.extract_hooks(hooks_prompt)
+            hook_items = self.chatgpt_client.extract_hooks_batch(hooks_prompt) if mode == "batch" else self.chatgpt_client.extract_hooks(hooks_prompt)
+
+            if self.llm_cache and cache_key:
+                self.llm_cache.set(cache_key, [asdict(item) for item in hook_items])
 
-            return HooksExtractionResult(items=hook_items, original_transcription=transcription)
+            # 同じ内容のフックは同じ台本になるため、重複を除いてから後続の処理・出力に渡す
+            return HooksExtractionResult(items=self._deduplicate_hook_items(hook_items), original_transcription=transcription)
 
         except Exception as e:
             raise HooksExtractionError(f"フック抽出に失敗しました: {e}") from e
 
-    def _generate_scripts_phase(self, hooks_result: HooksExtractionResult) -> list[DetailedScript]:
+    def _generate_scripts_phase(self, hooks_result: HooksExtractionResult, mode: Literal["sync", "batch"] = "sync") -> list[DetailedScript]:
         """フェーズ2: 詳細台本作成（並列）
 
         Args:
             hooks_result: フック抽出結果
+            mode: ChatGPT APIの呼び出し方法（"sync" または "batch"）
 
         Returns:
             詳細台本のリスト
@@ -245,10 +329,50 @@ class TranscriptToDraftUsecase:
 
         """
         try:
-            # 並列で詳細台本を生成
-            detailed_scripts = self.chatgpt_client.generate_detailed_scripts_parallel(
-                hooks_result.items, hooks_result.original_transcription.segments, self.prompt_builder
-            )
+            segments = hooks_result.original_transcription.segments
+
+            # フックはフック抽出フェーズで重複除去済み
+            hook_items = hooks_result.items
+
+            # キャッシュ済みのフックはAPI呼び出しを省略し、残りのフックのみ生成する
+            # 結果はフックの順序で並べ直すため、フックの位置ごとに保持する
+            scripts_by_index: dict[int, DetailedScript] = {}
+            cache_keys: dict[int, str] = {}
+            uncached_items: list[HookItem] = []
+            for index, hook_item in enumerate(hook_items):
+                if self.llm_cache:
+                    cache_key = self._make_script_cache_key(self.llm_cache, hook_item, segments)
+                    cached_script = self.llm_cache.get(cache_key)
+                    if cached_script is not None:
+                        try:
+                            scripts_by_index[index] = DetailedScript(hook_item=hook_item, segments_used=segments, **cached_script)
+                            continue
+                        except TypeError as e:
+                            # 形式が不正なキャッシュはキャッシュミスとして扱い、APIを呼び出して上書きする
+                            print(f"DEBUG: 詳細台本のキャッシュが不正なため無視します: {e}")
+                    cache_keys[index] = cache_key
+
+                uncached_items.append(hook_item)
+
+            if scripts_by_index:
+                print(f"DEBUG: 詳細台本 {len(scripts_by_index)}件をキャッシュから読み込みました")
+
+            # 並列（またはBatch API）で詳細台本を生成
+            if uncached_items:
+                if mode == "batch":
+                    generated_scripts = self.chatgpt_client.generate_detailed_scripts_batch(uncached_items, segments, self.prompt_builder)
+                else:
+                    generated_scripts = self.chatgpt_client.generate_detailed_scripts_parallel(uncached_items, segments, self.prompt_builder)
+
+                # 生成結果は完了順に返るため、フックの内容から元の位置を引く（重複除去済みなので内容は一意）
+                hook_indexes = {astuple(hook_item): index for index, hook_item in enumerate(hook_items)}
+                for script in generated_scripts:
+                    index = hook_indexes[astuple(script.hook_item)]
+                    scripts_by_index[index] = script
+                    if self.llm_cache:
+                        self.llm_cache.set(cache_keys[index], {"script_content": script.script_content, "duration_seconds": script.duration_seconds})
+
+            detailed_scripts = [scripts_by_index[index] for index in sorted(scripts_by_index)]
 
             if not detailed_scripts:
                 raise ScriptGenerationError("全ての台本生成に失敗しました")
@@ -258,8 +382,57 @@ class TranscriptToDraftUsecase:
         except Exception as e:
             raise ScriptGenerationError(f"詳細台本生成に失敗しました: {e}") from e
 
+    def _deduplicate_hook_items(self, hook_items: list[HookItem]) -> list[HookItem]:
+        """内容が重複するフックを除外
+
+        全角・半角、大文字・小文字、空白の違いを無視して4つのフィールドが一致するものを重複とみなす。
+
+        Args:
+            hook_items: フックアイテムのリスト
+
+        Returns:
+            重複を除いたフックアイテムのリスト（元の順序を維持）
+
+        """
+        unique_items: dict[tuple[str, ...], HookItem] = {}
+        for item in hook_items:
+            key = tuple(
+                "".join(unicodedata.normalize("NFKC", text).casefold().split()) for text in (item.first_hook, item.second_hook, item.third_hook, item.summary)
+            )
+            unique_items.setdefault(key, item)
+
+        if len(unique_items) < len(hook_items):
+            print(f"DEBUG: 重複したフック {len(hook_items) - len(unique_items)}件を除外しました")
+
+        return list(unique_items.values())
+
+    def _make_script_cache_key(self, llm_cache: LLMCache, hook_item: HookItem, segments: list[TranscriptionSegment]) -> str:
+        """詳細台本のキャッシュキーを生成
+
+        Args:
+            llm_cache: LLM応答キャッシュ
+            hook_item: フック情報
+            segments: 文字起こしセグメント
+
+        Returns:
+            キャッシュキー
+
+        """
+        return llm_cache.make_key(
+            phase="script",
+            model=self.chatgpt_client.model,
+            template=self.prompt_builder.SCRIPT_PROMPT_TEMPLATE,
+            hook_item=asdict(hook_item),
+            segments=[[segment.start_time, segment.end_time, segment.text] for segment in segments],
+        )
+
     def _generate_output_files(
-        self, hooks_result: HooksExtractionResult, detailed_scripts: list[DetailedScript], transcript_file_path: str, output_dir: str
+        self,
+        hooks_result: HooksExtractionResult,
+        detailed_scripts: list[DetailedScript],
+        transcript_file_path: str,
+        output_dir: str,
+        subtitle_file_path: str,
     ) -> TranscriptToDraftResult:
         """結果統合とファイル出力
 
@@ -268,6 +441,7 @@ class TranscriptToDraftUsecase:
             detailed_scripts: 詳細台本のリスト
             transcript_file_path: 元の文字起こしファイルパス
             output_dir: 出力ディレクトリ
+            subtitle_file_path: 生成済みの字幕ファイルのパス
 
         Returns:
             処理結果
@@ -278,14 +452,21 @@ class TranscriptToDraftUsecase:
             transcript_name = Path(transcript_file_path).stem
             video_name = transcript_name.replace("_transcript", "")
 
-            # 1. フック抽出結果をJSONで保存
-            self._save_hooks_result(hooks_result, video_name, output_dir)
+            output_path = Path(output_dir)
+
+            # 両ファイルに同じ生成日時を記録する
+            generated_at = self._get_current_datetime()
+
+            # 2つのファイル出力は互いに独立しているため並列で実行（字幕ファイルはLLM処理中に生成済み）
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # 1. フック抽出結果をJSONで保存
+                hooks_future = executor.submit(self._save_hooks_result, hooks_result, video_name, output_path, generated_at)
 
-            # 2. 詳細台本をMarkdownで保存
-            scripts_file_path = self._save_detailed_scripts(detailed_scripts, video_name, output_dir)
+                # 2. 詳細台本をMarkdownで保存
+                scripts_future = executor.submit(self._save_detailed_scripts, detailed_scripts, video_name, output_path, generated_at)
 
-            # 3. 字幕ファイル生成（既存処理）
-            subtitle_file_path = self._generate_subtitle_file(hooks_result.original_transcription, transcript_file_path, output_dir)
+                hooks_future.result()
+                scripts_file_path = scripts_future.result()
 
             return TranscriptToDraftResult(
                 success=True,
@@ -297,12 +478,12 @@ class TranscriptToDraftUsecase:
         except Exception as e:
             raise DraftGenerationError(f"出力ファイル生成に失敗しました: {e!s}") from e
 
-    def _save_hooks_result(self, hooks_result: HooksExtractionResult, video_name: str, output_dir: str) -> str:
+    def _save_hooks_result(self, hooks_result: HooksExtractionResult, video_name: str, output_path: Path, generated_at: str) -> str:
         """フック抽出結果をJSONファイルに保存"""
-        hooks_file_path = Path(output_dir) / f"{video_name}_hooks.json"
+        hooks_file_path = output_path / f"{video_name}_hooks.json"
 
         hooks_data = {
-            "extraction_timestamp": self._get_current_datetime(),
+            "extraction_timestamp": generated_at,
             "original_video": video_name,
             "items": [
                 {
@@ -315,61 +496,86 @@ class TranscriptToDraftUsecase:
             ],
         }
 
-        with open(hooks_file_path, "w", encoding="utf-8") as f:
-            json.dump(hooks_data, f, ensure_ascii=False, indent=2)
+        with open(hooks_file_path, "wb") as f:
+            f.write(orjson.dumps(hooks_data, option=orjson.OPT_INDENT_2))
 
         return str(hooks_file_path)
 
-    def _save_detailed_scripts(self, detailed_scripts: list[DetailedScript], video_name: str, output_dir: str) -> str:
+    def _save_detailed_scripts(self, detailed_scripts: list[DetailedScript], video_name: str, output_path: Path, generated_at: str) -> str:
         """詳細台本をMarkdownファイルに保存"""
-        scripts_file_path = Path(output_dir) / f"企画案_{video_name}.md"
-
-        content_lines = [
-            "# 詳細台本集",
-            "",
-            f"**元動画**: {video_name}",
-            f"**生成日時**: {self._get_current_datetime()}",
-            f"**台本数**: {len(detailed_scripts)}",
-            "",
-            "---",
-            "",
-        ]
-
-        for i, script in enumerate(detailed_scripts, 1):
-            content_lines.extend(
-                [
-                    f"## フック{i}: {script.hook_item.summary}",
-                    "",
-                    f"**想定時間**: {script.duration_seconds}秒",
-                    "",
-                    "### フック詳細",
-                    f"- **First Hook**: {script.hook_item.first_hook}",
-                    f"- **Second Hook**: {script.hook_item.second_hook}",
-                    f"- **Third Hook**: {script.hook_item.third_hook}",
-                    "",
-                    "### 台本内容",
-                    script.script_content,
-                    "",
-                    "---",
-                    "",
-                ]
-            )
-
-        content = "\n".join(content_lines)
+        scripts_file_path = output_path / f"企画案_{video_name}.md"
+
+        header = "\n".join(
+            [
+                "# 詳細台本集",
+                "",
+                f"**元動画**: {video_name}",
+                f"**生成日時**: {generated_at}",
+                f"**台本数**: {len(detailed_scripts)}",
+                "",
+                "---",
+                "",
+            ]
+        )
 
+        # 文書全体を組み立てずに台本ごとに書き出す
         with open(scripts_file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+            f.write(header)
+            f.writelines("\n" + self._render_script_section(i, script) for i, script in enumerate(detailed_scripts, 1))
 
         return str(scripts_file_path)
 
-    def _generate_subtitle_file(self, transcription: TranscriptionResult, transcript_file_path: str, output_dir: str) -> str:
-        """SRT字幕ファイルを生成
+    def _render_script_section(self, index: int, script: DetailedScript) -> str:
+        """詳細台本1件分のMarkdownを生成
+
+        Args:
+            index: 台本の番号（1始まり）
+            script: 詳細台本
+
+        Returns:
+            Markdown文字列
+
+        """
+        return (
+            f"## フック{index}: {script.hook_item.summary}\n"
+            "\n"
+            f"**想定時間**: {script.duration_seconds}秒\n"
+            "\n"
+            "### フック詳細\n"
+            f"- **First Hook**: {script.hook_item.first_hook}\n"
+            f"- **Second Hook**: {script.hook_item.second_hook}\n"
+            f"- **Third Hook**: {script.hook_item.third_hook}\n"
+            "\n"
+            "### 台本内容\n"
+            f"{script.script_content}\n"
+            "\n"
+            "---\n"
+        )
+
+    def _get_subtitle_file_path(self, transcript_file_path: str, output_dir: str) -> str:
+        """SRT字幕ファイルの出力先パスを取得
 
         Args:
-            transcription: 文字起こし結果
             transcript_file_path: 元の文字起こしファイルパス
             output_dir: 出力ディレクトリ
 
+        Returns:
+            字幕ファイルのパス
+
+        """
+        # transcript.jsonのファイル名から元の動画名を推定
+        transcript_name = Path(transcript_file_path).stem
+        video_name = transcript_name.replace("文字起こし_", "")
+
+        return str(Path(output_dir) / f"字幕_{video_name}.srt")
+
+    def _generate_subtitle_file(self, transcription: TranscriptionResult, subtitle_file_path: str) -> str:
+        """SRT字幕ファイルを生成
+
+        Args:
+            transcription: 文字起こし結果
+            subtitle_file_path: 出力する字幕ファイルのパス
+
         Returns:
             生成されたファイルのパス
 
@@ -378,14 +584,8 @@ class TranscriptToDraftUsecase:
 
         """
         try:
-            # transcript.jsonのファイル名から元の動画名を推定
-            transcript_name = Path(transcript_file_path).stem
-            video_name = transcript_name.replace("文字起こし_", "")
-
-            subtitle_file_path = Path(output_dir) / f"字幕_{video_name}.srt"
-
             # SrtGeneratorに処理を委譲
-            return self.srt_generator.generate_srt_file(transcription, str(subtitle_file_path))
+            return self.srt_generator.generate_srt_file(transcription, subtitle_file_path)
 
         except Exception as e:
             raise DraftGenerationError(f"字幕ファイルの生成に失敗しました: {e!s}") from e
@@ -397,4 +597,4 @@ class TranscriptToDraftUsecase:
             現在の日時文字列
 
         """
-        return datetime.now(ZoneInfo("Asia/Tokyo")).strftime("%Y-%m-%d %H:%M:%S")
+        return datetime.now(JST).strftime("%Y-%m-%d %H:%M:%S")
@@ -1,15 +1,20 @@
 """動画→文字起こしユースケース"""
 
-import json
 import os
+import stat
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import orjson
+
 from ..clients.whisper_client import WhisperClient
 from ..models.transcription import TranscriptionResult
 from ..models.usecase_results import VideoToTranscriptResult
 
+# 日時の記録に使用するタイムゾーン（日本時間）
+JST = ZoneInfo("Asia/Tokyo")
+
 
 class VideoToTranscriptUsecaseError(Exception):
     """VideoToTranscriptUsecase関連のベース例外"""
@@ -101,10 +106,13 @@ class VideoToTranscriptUsecase:
         if not video_path or not video_path.strip():
             raise VideoInputValidationError("動画ファイルパスが指定されていません", "video_path")
 
-        if not os.path.exists(video_path):
-            raise VideoInputValidationError(f"動画ファイルが存在しません: {video_path}", "video_path")
+        # 存在確認とファイル種別の確認を1回のstatで行う
+        try:
+            file_stat = os.stat(video_path)
+        except OSError as e:
+            raise VideoInputValidationError(f"動画ファイルが存在しません: {video_path}", "video_path") from e
 
-        if not os.path.isfile(video_path):
+        if not stat.S_ISREG(file_stat.st_mode):
             raise VideoInputValidationError(f"指定されたパスはファイルではありません: {video_path}", "video_path")
 
         if not intermediate_dir or not intermediate_dir.strip():
@@ -159,8 +167,8 @@ class VideoToTranscriptUsecase:
             # 文字起こし結果をシリアライズ
             data = self._serialize_transcription(transcription, video_path)
 
-            with open(transcript_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(transcript_file, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
             return str(transcript_file)
 
@@ -181,7 +189,7 @@ class VideoToTranscriptUsecase:
         return {
             "video_name": Path(video_path).name,
             "video_path": video_path,
-            "created_at": datetime.now(ZoneInfo("Asia/Tokyo")).isoformat(),
+            "created_at": datetime.now(JST).isoformat(),
             "full_text": transcription.full_text,
             "segments": [
                 {
@@ -0,0 +1,22 @@
+"""テスト全体で共通のフィクスチャ"""
+
+import os
+
+import pytest
+
+from src.builders.prompt_builder import PromptBuilder
+from src.clients.chatgpt_client import ChatGPTClient
+from src.clients.whisper_client import WhisperClient
+
+
+@pytest.fixture(scope="session")
+def openai_clients() -> tuple[WhisperClient, ChatGPTClient, PromptBuilder]:
+    """統合テスト用のクライアント一式（セッション内で1回だけ生成し、HTTP接続を使い回す）
+
+    OPENAI_API_KEYが設定されていない場合は、このフィクスチャを使うテストをスキップする。
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        pytest.skip("OPENAI_API_KEYが設定されていません")
+
+    return WhisperClient(api_key), ChatGPTClient(api_key), PromptBuilder()
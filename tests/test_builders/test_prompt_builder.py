@@ -3,9 +3,16 @@
 import pytest
 
 from src.builders.prompt_builder import PromptBuilder
+from src.models.hooks import HookItem
 from src.models.transcription import TranscriptionResult, TranscriptionSegment
 
 
+@pytest.fixture(scope="module")
+def builder():
+    """モジュール内で共有するPromptBuilder（状態を持たないため使い回せる）"""
+    return PromptBuilder()
+
+
 class TestPromptBuilder:
     """PromptBuilderの基本機能テスト"""
 
@@ -14,11 +21,10 @@ class TestPromptBuilder:
         builder = PromptBuilder()
         assert builder is not None
 
-    def test_build_hooks_prompt_basic(self):
+    def test_build_hooks_prompt_basic(self, builder):
         """基本的なプロンプト生成テスト"""
         segments = [TranscriptionSegment(0.0, 10.0, "テスト内容")]
         transcription = TranscriptionResult(segments, "テスト内容")
-        builder = PromptBuilder()
 
         prompt = builder.build_hooks_prompt(transcription)
 
@@ -28,11 +34,10 @@ class TestPromptBuilder:
         assert "出力フォーマット" in prompt
         assert "first_hook" in prompt
 
-    def test_prompt_contains_best_practices(self):
+    def test_prompt_contains_best_practices(self, builder):
         """プロンプトにベストプラクティスが含まれているかテスト"""
         segments = [TranscriptionSegment(0.0, 10.0, "テスト")]
         transcription = TranscriptionResult(segments, "テスト")
-        builder = PromptBuilder()
 
         prompt = builder.build_hooks_prompt(transcription)
 
@@ -40,46 +45,41 @@ class TestPromptBuilder:
         assert "ショート動画バズのコツ" in prompt
         assert "驚きで惹きつける（Surprise）" in prompt
 
-    def test_validation_empty_segments(self):
+    def test_validation_empty_segments(self, builder):
         """空のセグメントでのバリデーションテスト"""
         transcription = TranscriptionResult([], "テスト")
-        builder = PromptBuilder()
 
         with pytest.raises(ValueError) as exc_info:
             builder.build_hooks_prompt(transcription)
         assert "セグメントが空です" in str(exc_info.value)
 
-    def test_validation_empty_full_text(self):
+    def test_validation_empty_full_text(self, builder):
         """空の全体テキストでのバリデーションテスト"""
         segments = [TranscriptionSegment(0.0, 10.0, "テスト")]
         transcription = TranscriptionResult(segments, "")
-        builder = PromptBuilder()
 
         with pytest.raises(ValueError) as exc_info:
             builder.build_hooks_prompt(transcription)
         assert "全体テキストが空です" in str(exc_info.value)
 
-    def test_validation_whitespace_only_full_text(self):
+    def test_validation_whitespace_only_full_text(self, builder):
         """空白のみの全体テキストでのバリデーションテスト"""
         segments = [TranscriptionSegment(0.0, 10.0, "テスト")]
         transcription = TranscriptionResult(segments, "   \n\t  ")
-        builder = PromptBuilder()
 
         with pytest.raises(ValueError) as exc_info:
             builder.build_hooks_prompt(transcription)
         assert "全体テキストが空です" in str(exc_info.value)
 
-    def test_string_representation(self):
+    def test_string_representation(self, builder):
         """文字列表現のテスト"""
-        builder = PromptBuilder()
         str_repr = str(builder)
         assert "PromptBuilder" in str_repr
 
-    def test_field_types(self):
+    def test_field_types(self, builder):
         """フィールドの型の正確性のテスト"""
         segments = [TranscriptionSegment(0.0, 10.0, "テスト")]
         transcription = TranscriptionResult(segments, "テスト")
-        builder = PromptBuilder()
 
         prompt = builder.build_hooks_prompt(transcription)
         assert isinstance(prompt, str)
@@ -88,37 +88,30 @@ class TestPromptBuilder:
 class TestTimeFormatting:
     """時刻フォーマット機能テスト"""
 
-    def test_format_time_to_hms_basic(self):
+    def test_format_time_to_hms_basic(self, builder):
         """基本的な時刻フォーマットテスト"""
-        builder = PromptBuilder()
-
         assert builder._format_time_to_hms(0.0) == "00:00:00"
         assert builder._format_time_to_hms(65.0) == "00:01:05"
         assert builder._format_time_to_hms(3661.0) == "01:01:01"
 
-    def test_format_time_to_hms_edge_cases(self):
+    def test_format_time_to_hms_edge_cases(self, builder):
         """時刻フォーマットのエッジケーステスト"""
-        builder = PromptBuilder()
-
         assert builder._format_time_to_hms(59.0) == "00:00:59"
         assert builder._format_time_to_hms(60.0) == "00:01:00"
         assert builder._format_time_to_hms(3599.0) == "00:59:59"
         assert builder._format_time_to_hms(3600.0) == "01:00:00"
 
-    def test_format_time_to_hms_fractional_seconds(self):
+    def test_format_time_to_hms_fractional_seconds(self, builder):
         """小数点を含む秒数のフォーマットテスト"""
-        builder = PromptBuilder()
-
         assert builder._format_time_to_hms(65.7) == "00:01:05"
         assert builder._format_time_to_hms(3661.9) == "01:01:01"
 
-    def test_format_segments_basic(self):
+    def test_format_segments_basic(self, builder):
         """基本的なセグメントフォーマットテスト"""
         segments = [
             TranscriptionSegment(0.0, 30.0, "最初の内容"),
             TranscriptionSegment(30.0, 90.0, "次の内容"),
         ]
-        builder = PromptBuilder()
 
         formatted = builder._format_segments(segments)
 
@@ -127,14 +120,13 @@ class TestTimeFormatting:
         assert "最初の内容" in formatted
         assert "次の内容" in formatted
 
-    def test_format_segments_numbering(self):
+    def test_format_segments_numbering(self, builder):
         """セグメント番号付けのテスト"""
         segments = [
             TranscriptionSegment(0.0, 10.0, "第一"),
             TranscriptionSegment(10.0, 20.0, "第二"),
             TranscriptionSegment(20.0, 30.0, "第三"),
         ]
-        builder = PromptBuilder()
 
         formatted = builder._format_segments(segments)
         lines = formatted.split("\n")
@@ -143,16 +135,14 @@ class TestTimeFormatting:
         assert "  2." in lines[1]
         assert "  3." in lines[2]
 
-    def test_format_segments_empty_list(self):
+    def test_format_segments_empty_list(self, builder):
         """空のセグメントリストのフォーマットテスト"""
-        builder = PromptBuilder()
         formatted = builder._format_segments([])
         assert formatted == ""
 
-    def test_format_segments_single_item(self):
+    def test_format_segments_single_item(self, builder):
         """単一セグメントのフォーマットテスト"""
         segments = [TranscriptionSegment(0.0, 10.0, "単一内容")]
-        builder = PromptBuilder()
 
         formatted = builder._format_segments(segments)
 
@@ -164,7 +154,7 @@ class TestTimeFormatting:
 class TestSampleData:
     """サンプルデータを使った統合テスト"""
 
-    def test_short_video_sample_data(self):
+    def test_short_video_sample_data(self, builder):
         """ショート動画向けサンプルデータでのテスト"""
         short_video_segments = [
             TranscriptionSegment(0.0, 5.0, "皆さん、これ知ってました？実は..."),
@@ -181,7 +171,6 @@ class TestSampleData:
             ),
         )
 
-        builder = PromptBuilder()
         prompt = builder.build_hooks_prompt(short_video_transcription)
 
         assert isinstance(prompt, str)
@@ -199,7 +188,7 @@ class TestSampleData:
         assert "ショート動画バズのコツ" in prompt
         assert "出力フォーマット" in prompt
 
-    def test_realistic_usage_pattern(self):
+    def test_realistic_usage_pattern(self, builder):
         """実際の使用パターンに近いテスト"""
         segments = [
             TranscriptionSegment(0.0, 2.1, "皆さん、こんにちは"),
@@ -213,7 +202,6 @@ class TestSampleData:
 
         transcription = TranscriptionResult(segments=segments, full_text=full_text)
 
-        builder = PromptBuilder()
         prompt = builder.build_hooks_prompt(transcription)
 
         assert isinstance(prompt, str)
@@ -228,7 +216,7 @@ class TestSampleData:
         assert "Pythonについて" in prompt
         assert "始めていきましょう" in prompt
 
-    def test_long_duration_formatting(self):
+    def test_long_duration_formatting(self, builder):
         """長時間動画のフォーマットテスト"""
         segments = [
             TranscriptionSegment(0.0, 3600.0, "1時間の内容"),
@@ -237,17 +225,15 @@ class TestSampleData:
 
         transcription = TranscriptionResult(segments=segments, full_text="1時間の内容2時間目の内容")
 
-        builder = PromptBuilder()
         prompt = builder.build_hooks_prompt(transcription)
 
         assert "[01:00:00 - 02:00:00]" in prompt
         assert "[00:00:00 - 01:00:00]" in prompt
 
-    def test_prompt_template_consistency(self):
+    def test_prompt_template_consistency(self, builder):
         """プロンプトテンプレートの一貫性テスト"""
         segments = [TranscriptionSegment(0.0, 10.0, "テスト")]
         transcription = TranscriptionResult(segments, "テスト")
-        builder = PromptBuilder()
 
         prompt = builder.build_hooks_prompt(transcription)
 
@@ -272,3 +258,16 @@ class TestSampleData:
 
         for field in required_json_fields:
             assert field in prompt
+
+    def test_prompts_place_static_content_first(self, builder):
+        """プロンプトキャッシュのため固定部分が動的な入力より前にあるテスト"""
+        segments = [TranscriptionSegment(0.0, 10.0, "テスト内容")]
+        transcription = TranscriptionResult(segments, "テスト内容")
+        hook_item = HookItem("フック1", "フック2", "フック3", "要約")
+
+        hooks_prompt = builder.build_hooks_prompt(transcription)
+        script_prompt = builder.build_script_prompt(hook_item, segments)
+
+        assert hooks_prompt.startswith(builder.HOOKS_PROMPT_TEMPLATE)
+        assert hooks_prompt.index("# 出力フォーマット") < hooks_prompt.index("テスト内容")
+        assert script_prompt.index("## 出力形式") < script_prompt.index("テスト内容") < script_prompt.index("フック1")
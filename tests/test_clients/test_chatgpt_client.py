@@ -7,11 +7,19 @@ from unittest.mock import Mock, patch
 import pytest
 
 from src.clients.chatgpt_client import (
+    ChatGPTAPIError,
     ChatGPTClient,
     JSONParseError,
     ValidationError,
 )
-from src.models.hooks import HookItem
+from src.models.hooks import DetailedScript, HookItem
+from src.models.transcription import TranscriptionSegment
+
+
+@pytest.fixture(scope="module")
+def client():
+    """モジュール内で共有するChatGPTClient（状態を変更しないテスト用）"""
+    return ChatGPTClient("test-api-key")
 
 
 class TestChatGPTClient:
@@ -28,85 +36,162 @@ class TestChatGPTClient:
         client = ChatGPTClient("test-api-key", model="gpt-3.5-turbo")
         assert client.model == "gpt-3.5-turbo"
 
+    def test_init_custom_max_concurrency(self):
+        """最大同時リクエスト数指定の初期化テスト"""
+        client = ChatGPTClient("test-api-key", max_concurrency=3)
+        assert client.max_concurrency == 3
+
+    def test_generate_detailed_scripts_parallel_skips_failed_hooks(self):
+        """並列台本生成で失敗したフックを除いた結果が返るテスト"""
+        client = ChatGPTClient("test-api-key", max_concurrency=2)
+        hook_items = [HookItem(f"hook{i}", "hook2", "hook3", f"summary{i}") for i in range(3)]
+        segments = [TranscriptionSegment(0.0, 10.0, "テスト")]
+        prompt_builder = Mock()
+        prompt_builder.build_script_prompt.side_effect = lambda hook_item, _segments: hook_item.summary
+
+        def generate(prompt, hook_item):
+            if prompt == "summary1":
+                raise ValueError("生成失敗")
+            return DetailedScript(hook_item, f"台本{prompt}", 60, [])
+
+        # テスト用のインスタンスなので、patchを使わずメソッドを直接差し替える
+        client.generate_detailed_script = generate  # type: ignore[method-assign]
+        scripts = client.generate_detailed_scripts_parallel(hook_items, segments, prompt_builder)
+
+        assert sorted(script.hook_item.summary for script in scripts) == ["summary0", "summary2"]
+        assert all(script.segments_used == segments for script in scripts)
+
+    def test_call_chatgpt_batch_api_orders_results(self):
+        """Batch APIの結果がプロンプトの順序で返り、失敗分はNoneになるテスト"""
+        sleep_calls: list[float] = []
+        client = ChatGPTClient("test-api-key", sleep_fn=sleep_calls.append)
+        client.client = Mock()
+        client.client.files.create.return_value = Mock(id="file-input")
+        client.client.batches.create.return_value = Mock(id="batch-1", status="in_progress")
+        client.client.batches.retrieve.return_value = Mock(id="batch-1", status="completed", output_file_id="file-output")
+        output_lines = [
+            {"custom_id": "2", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": "結果2"}}]}}},
+            {"custom_id": "0", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": "結果0"}}]}}},
+            {"custom_id": "1", "response": {"status_code": 500, "body": {}}},
+        ]
+        client.client.files.content.return_value.text = "\n".join(json.dumps(line) for line in output_lines)
+
+        results = client._call_chatgpt_batch_api(["p0", "p1", "p2"])
+
+        assert results == ["結果0", None, "結果2"]
+        assert sleep_calls == [30.0]
+
+    def test_call_chatgpt_batch_api_timeout(self):
+        """最大待機時間を超えても完了しないバッチはキャンセルしてエラーにするテスト"""
+        sleep_calls: list[float] = []
+        client = ChatGPTClient("test-api-key", batch_max_wait_seconds=90, sleep_fn=sleep_calls.append)
+        client.client = Mock()
+        client.client.files.create.return_value = Mock(id="file-input")
+        client.client.batches.create.return_value = Mock(id="batch-1", status="validating")
+        client.client.batches.retrieve.return_value = Mock(id="batch-1", status="in_progress")
+
+        with pytest.raises(ChatGPTAPIError, match="バッチ処理が90秒以内に完了しませんでした"):
+            client._call_chatgpt_batch_api(["p0"])
+
+        assert sleep_calls == [30.0, 30.0, 30.0]
+        client.client.batches.cancel.assert_called_once_with("batch-1")
+        client.client.files.content.assert_not_called()
+
+    def test_call_chatgpt_batch_api_skips_malformed_records(self):
+        """Batch APIの出力に不正なレコードが含まれていても、正常なレコードの結果が返るテスト"""
+        client = ChatGPTClient("test-api-key")
+        client.client = Mock()
+        client.client.files.create.return_value = Mock(id="file-input")
+        client.client.batches.create.return_value = Mock(id="batch-1", status="completed", output_file_id="file-output")
+        output_lines = [
+            "{不正なJSON",
+            json.dumps({"response": {"status_code": 200, "body": {"choices": [{"message": {"content": "custom_idなし"}}]}}}),
+            json.dumps({"custom_id": "1", "response": {"status_code": 200, "body": {"choices": []}}}),
+            json.dumps({"custom_id": "2", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": "結果2"}}]}}}),
+        ]
+        client.client.files.content.return_value.text = "\n".join(output_lines)
+
+        results = client._call_chatgpt_batch_api(["p0", "p1", "p2"])
+
+        assert results == [None, None, "結果2"]
+
     def test_init_empty_api_key(self):
         """空のAPIキーでの初期化エラーテスト"""
         with pytest.raises(ValueError, match="APIキーが指定されていません"):
             ChatGPTClient("")
 
-    def test_validate_prompt_empty(self):
+    def test_validate_prompt_empty(self, client):
         """空のプロンプトの検証エラーテスト"""
-        client = ChatGPTClient("test-api-key")
         with pytest.raises(ValueError, match="プロンプトが空です"):
             client._validate_prompt("")
 
-    def test_validate_prompt_too_long(self):
+    def test_validate_prompt_too_long(self, client):
         """長すぎるプロンプトの検証エラーテスト"""
-        client = ChatGPTClient("test-api-key")
         long_prompt = "a" * 100001
         with pytest.raises(ValueError, match="プロンプトが長すぎます"):
             client._validate_prompt(long_prompt)
 
-    def test_parse_json_response_success(self):
+    def test_parse_json_response_success(self, client):
         """正常なJSON解析のテスト"""
-        client = ChatGPTClient("test-api-key")
         json_response = '{"items": [{"title": "test"}]}'
         result = client._parse_json_response(json_response)
         assert result == {"items": [{"title": "test"}]}
 
-    def test_parse_json_response_with_markdown(self):
+    def test_parse_json_response_with_markdown(self, client):
         """Markdownコードブロック付きJSON解析のテスト"""
-        client = ChatGPTClient("test-api-key")
         json_response = '```json\n{"items": [{"title": "test"}]}\n```'
         result = client._parse_json_response(json_response)
         assert result == {"items": [{"title": "test"}]}
 
-    def test_parse_json_response_invalid(self):
+    def test_parse_json_response_invalid(self, client):
         """無効なJSON解析のエラーテスト"""
-        client = ChatGPTClient("test-api-key")
         with pytest.raises(JSONParseError):
             client._parse_json_response("invalid json")
 
-    def test_validate_hooks_response_structure_missing_items(self):
-        """itemsフィールドが欠けているレスポンスの検証エラーテスト"""
-        client = ChatGPTClient("test-api-key")
-        with pytest.raises(ValidationError, match="'items'フィールドがありません"):
-            client._validate_hooks_response_structure({})
-
-    def test_validate_hooks_response_structure_items_not_list(self):
-        """itemsがリストでないレスポンスの検証エラーテスト"""
-        client = ChatGPTClient("test-api-key")
-        with pytest.raises(ValidationError, match="'items'フィールドがリスト形式ではありません"):
-            client._validate_hooks_response_structure({"items": "not a list"})
-
-    def test_validate_hooks_response_structure_empty_items(self):
-        """空のitemsの検証エラーテスト"""
-        client = ChatGPTClient("test-api-key")
-        with pytest.raises(ValidationError, match="'items'が空です"):
-            client._validate_hooks_response_structure({"items": []})
-
-    def test_validate_hooks_response_structure_missing_required_field(self):
-        """必須フィールドが欠けているアイテムの検証エラーテスト"""
-        client = ChatGPTClient("test-api-key")
-        data = {"items": [{"title": "test"}]}
-        with pytest.raises(ValidationError, match="必須フィールド"):
+    @pytest.mark.parametrize(
+        "data,message",
+        [
+            ({}, "'items'フィールドがありません"),
+            ({"items": "not a list"}, "'items'フィールドがリスト形式ではありません"),
+            ({"items": []}, "'items'が空です"),
+            ({"items": [{"title": "test"}]}, "必須フィールド"),
+            ({"items": ["first_hook"]}, "辞書形式ではありません"),
+        ],
+        ids=["missing_items", "items_not_list", "empty_items", "missing_required_field", "item_not_dict"],
+    )
+    def test_validate_hooks_response_structure_errors(self, client, data, message):
+        """構造が不正なフック抽出レスポンスの検証エラーテスト"""
+        with pytest.raises(ValidationError, match=message):
             client._validate_hooks_response_structure(data)
 
-    def test_parse_time_to_seconds_success(self):
+    @pytest.mark.parametrize(
+        "time_str,expected",
+        [
+            ("01:30:45", 5445.0),
+            ("00:00:30", 30.0),
+            ("02:00:00", 7200.0),
+            ("00:00:00", 0.0),
+        ],
+    )
+    def test_parse_time_to_seconds_success(self, client, time_str, expected):
         """正常な時刻解析のテスト"""
-        client = ChatGPTClient("test-api-key")
-        assert client._parse_time_to_seconds("01:30:45") == 5445.0
-        assert client._parse_time_to_seconds("00:00:30") == 30.0
-        assert client._parse_time_to_seconds("02:00:00") == 7200.0
-
-    def test_parse_time_to_seconds_invalid_format(self):
+        assert client._parse_time_to_seconds(time_str) == expected
+
+    @pytest.mark.parametrize(
+        "time_str,message",
+        [
+            ("invalid", "時刻形式が無効です"),
+            ("01:30", "時刻形式が無効です"),
+            ("01:xx:45", "時刻の解析に失敗しました"),
+        ],
+    )
+    def test_parse_time_to_seconds_invalid_format(self, client, time_str, message):
         """無効な時刻形式の解析エラーテスト"""
-        client = ChatGPTClient("test-api-key")
-        with pytest.raises(ValueError, match="時刻形式が無効です"):
-            client._parse_time_to_seconds("invalid")
+        with pytest.raises(ValueError, match=message):
+            client._parse_time_to_seconds(time_str)
 
-    def test_convert_to_hook_items_success(self):
+    def test_convert_to_hook_items_success(self, client):
         """正常なフック変換のテスト"""
-        client = ChatGPTClient("test-api-key")
         data = {
             "items": [
                 {
@@ -157,20 +242,15 @@ class TestChatGPTClient:
         mock_client.chat.completions.create.assert_called_once()
 
 
+@pytest.mark.slow
 @pytest.mark.integration
+@pytest.mark.skipif(not os.getenv("INTEGRATION_TEST"), reason="統合テストはINTEGRATION_TEST=trueの場合のみ実行")
 class TestChatGPTClientIntegration:
     """ChatGPTClientの統合テスト（実際のAPI呼び出し）"""
 
-    def test_extract_hooks_real_api(self):
+    def test_extract_hooks_real_api(self, openai_clients):
         """実際のChatGPT APIを使用した企画書生成テスト"""
-        if not os.getenv("INTEGRATION_TEST"):
-            pytest.skip("統合テストはINTEGRATION_TEST=trueの場合のみ実行")
-
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            pytest.skip("OPENAI_API_KEYが設定されていません")
-
-        client = ChatGPTClient(api_key)
+        _, client, _ = openai_clients
 
         test_prompt = """
         以下の動画の書き起こしテキストから、切り抜き動画として適切な部分の概要を抜き出してください。
@@ -1,23 +1,62 @@
 """GoogleDriveClientの新機能テスト"""
 
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-from src.clients.google_drive_client import GoogleDriveClient
+import pytest
+
+from src.clients.google_drive_client import FileUploadError, GoogleDriveClient, GoogleDriveError
 from src.models.drive import DriveFile, DriveFolder
 
 
 class TestGoogleDriveClientExtensions:
     """GoogleDriveClientの拡張機能テスト"""
 
+    template_client: GoogleDriveClient
+
+    @classmethod
+    def setup_class(cls):
+        """認証・サービス構築をパッチしたクライアントをクラスで1回だけ生成"""
+        with patch("src.clients.google_drive_client.service_account"), patch("src.clients.google_drive_client.build"):
+            cls.template_client = GoogleDriveClient("dummy_path")
+
     def setup_method(self):
         """テストセットアップ"""
-        with patch("src.clients.google_drive_client.service_account"), patch("src.clients.google_drive_client.build"):
-            self.client = GoogleDriveClient("dummy_path")
-            self.client.service = Mock()
+        self.client = copy.copy(self.template_client)
+        self.client.service = Mock()
+        self.client._thread_local = threading.local()
+
+    def _set_list_response(self, files):
+        """files().list().execute()の戻り値を設定（Mockの呼び出し連鎖を使わない）"""
+        response = {"files": files}
+        self.client.service = SimpleNamespace(files=lambda: SimpleNamespace(list=lambda **_: SimpleNamespace(execute=lambda: response)))
+
+    def test_get_thread_service_owner_thread_reuses_service(self):
+        """クライアントを初期化したスレッドではself.serviceを使い回すテスト"""
+        with patch("src.clients.google_drive_client.build") as mock_build:
+            assert self.client._get_thread_service() is self.client.service
+
+        mock_build.assert_not_called()
+
+    def test_get_thread_service_worker_thread_builds_own_service(self):
+        """別スレッドでは専用のサービスを1回だけ構築し、同じスレッド内で使い回すテスト"""
+        with (
+            patch("src.clients.google_drive_client.build", side_effect=lambda *args, **kwargs: Mock()) as mock_build,
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            first = executor.submit(self.client._get_thread_service).result()
+            second = executor.submit(self.client._get_thread_service).result()
+
+        assert first is second
+        assert first is not self.client.service
+        mock_build.assert_called_once_with("drive", "v3", credentials=self.client.credentials)
 
     def test_folder_exists_true(self):
         """フォルダが存在する場合のテスト"""
-        self.client.service.files().list().execute.return_value = {"files": [{"id": "folder123", "name": "test_folder"}]}
+        self._set_list_response([{"id": "folder123", "name": "test_folder"}])
 
         result = self.client.folder_exists("parent_id", "test_folder")
 
@@ -25,12 +64,76 @@ class TestGoogleDriveClientExtensions:
 
     def test_folder_exists_false(self):
         """フォルダが存在しない場合のテスト"""
-        self.client.service.files().list().execute.return_value = {"files": []}
+        self._set_list_response([])
 
         result = self.client.folder_exists("parent_id", "test_folder")
 
         assert result is False
 
+    def test_find_folder_id(self):
+        """フォルダ名からフォルダIDを取得し、存在しない場合はNoneを返すテスト"""
+        self._set_list_response([{"id": "folder123"}])
+        assert self.client.find_folder_id("parent_id", "test_folder") == "folder123"
+
+        self._set_list_response([])
+        assert self.client.find_folder_id("parent_id", "test_folder") is None
+
+    def test_find_files_by_name(self):
+        """同名ファイルの一覧を取得するテスト"""
+        files = [{"id": "file1", "createdTime": "2025-01-01T00:00:00.000Z"}]
+        self._set_list_response(files)
+
+        assert self.client.find_files_by_name("parent_id", ".processing") == files
+
+    @pytest.mark.parametrize(
+        "search",
+        [
+            lambda client: client.find_folder_id("parent_id", "it's a \\ test"),
+            lambda client: client.find_files_by_name("parent_id", "it's a \\ test"),
+        ],
+        ids=["find_folder_id", "find_files_by_name"],
+    )
+    def test_search_query_escapes_name(self, search):
+        """名前に含まれるシングルクォートとバックスラッシュが検索クエリ内でエスケープされるテスト"""
+        self.client.service.files().list.return_value.execute.return_value = {"files": []}
+
+        search(self.client)
+
+        query = self.client.service.files().list.call_args.kwargs["q"]
+        assert "name='it\\'s a \\\\ test'" in query
+
+    def test_upload_bytes(self):
+        """メモリ上のデータをアップロードしてファイルIDを返すテスト"""
+        self.client.service.files().create.return_value.execute.return_value = {"id": "marker123"}
+
+        with patch("src.clients.google_drive_client.MediaInMemoryUpload") as mock_media:
+            result = self.client.upload_bytes(b"", "folder_id", ".processing")
+
+        assert result == "marker123"
+        mock_media.assert_called_once_with(b"", mimetype="application/octet-stream", resumable=False)
+        create_kwargs = self.client.service.files().create.call_args.kwargs
+        assert create_kwargs["body"] == {"name": ".processing", "parents": ["folder_id"]}
+
+    def test_upload_bytes_without_id(self):
+        """アップロード後にIDが返らない場合はFileUploadErrorになるテスト"""
+        self.client.service.files().create.return_value.execute.return_value = {}
+
+        with pytest.raises(FileUploadError, match="アップロード後のIDが取得できませんでした"):
+            self.client.upload_bytes(b"", "folder_id", ".processing")
+
+    def test_delete_file(self):
+        """ファイルを削除するテスト"""
+        self.client.delete_file("file123")
+
+        self.client.service.files().delete.assert_called_once_with(fileId="file123", supportsAllDrives=True)
+
+    def test_delete_file_failure(self):
+        """削除に失敗した場合はGoogleDriveErrorになるテスト"""
+        self.client.service.files().delete.return_value.execute.side_effect = RuntimeError("権限がありません")
+
+        with pytest.raises(GoogleDriveError, match="ファイルの削除に失敗しました"):
+            self.client.delete_file("file123")
+
     def test_list_folders(self):
         """サブフォルダ一覧取得のテスト"""
         with patch.object(self.client, "list_files") as mock_list_files:
@@ -45,3 +148,17 @@ class TestGoogleDriveClientExtensions:
 
             assert len(result) == 2
             assert all(f.mime_type == "application/vnd.google-apps.folder" for f in result)
+
+    def test_upload_file_small_file_uses_single_request(self, tmp_path):
+        """小さいファイルはresumableではなく1回のリクエストでアップロードされるテスト"""
+        file_path = tmp_path / "draft.md"
+        file_path.write_text("企画書", encoding="utf-8")
+        request = Mock()
+        request.execute.return_value = {"id": "file123", "webViewLink": "https://drive.google.com/file/d/file123/view"}
+        self.client.service.files().create.return_value = request
+
+        result = self.client.upload_file(str(file_path), "folder_id")
+
+        assert result == "https://drive.google.com/file/d/file123/view"
+        request.execute.assert_called_once()
+        request.next_chunk.assert_not_called()
@@ -0,0 +1,11 @@
+"""モデルテスト共通のフィクスチャ"""
+
+import pytest
+
+from src.models.transcription import TranscriptionSegment
+
+
+@pytest.fixture(scope="session")
+def sample_segment() -> TranscriptionSegment:
+    """テスト用の文字起こしセグメント（frozenのため共有しても変更されない）"""
+    return TranscriptionSegment(0.0, 3.5, "テスト")
@@ -1,37 +1,78 @@
 """draft.pyのテスト"""
 
+from dataclasses import replace
+
+import pytest
+
 from src.models.draft import DraftResult, ShortVideoProposal
 from src.models.transcription import TranscriptionResult, TranscriptionSegment
 
 
+def _make_proposals(specs: list[tuple[str, float, float, str, list[str]]]) -> list[ShortVideoProposal]:
+    """(title, start_time, end_time, caption, key_points)のタプルから企画提案のリストを生成"""
+    return [
+        ShortVideoProposal(title=title, start_time=start_time, end_time=end_time, caption=caption, key_points=key_points)
+        for title, start_time, end_time, caption, key_points in specs
+    ]
+
+
+def _sample_proposal() -> ShortVideoProposal:
+    """DraftResultのテストで共通に使う1件の企画提案を生成"""
+    return ShortVideoProposal(
+        title="タイトル1",
+        start_time=0.0,
+        end_time=5.0,
+        caption="キャプション1",
+        key_points=["ポイント1"],
+    )
+
+
+# インスタンス生成テストのケース（設計書のサンプルデータを含む）
+PROPOSAL_CASES = [
+    {
+        "title": "面白いトーク集",
+        "start_time": 30.0,
+        "end_time": 90.0,
+        "caption": "今日の面白い話をまとめました！",
+        "key_points": ["ポイント1", "ポイント2"],
+    },
+    {
+        "title": "タイトル1",
+        "start_time": 0.0,
+        "end_time": 5.0,
+        "caption": "キャプション1",
+        "key_points": ["ポイント1"],
+    },
+]
+
+
 class TestShortVideoProposal:
     """ShortVideoProposalのテストクラス"""
 
-    def test_instance_creation(self):
-        """インスタンス生成のテスト"""
-        proposal = ShortVideoProposal(
-            title="面白いトーク集",
-            start_time=30.0,
-            end_time=90.0,
-            caption="今日の面白い話をまとめました！",
-            key_points=["ポイント1", "ポイント2"],
-        )
-
-        assert proposal.title == "面白いトーク集"
-        assert proposal.start_time == 30.0
-        assert proposal.end_time == 90.0
-        assert proposal.caption == "今日の面白い話をまとめました！"
-        assert proposal.key_points == ["ポイント1", "ポイント2"]
+    base_proposal: ShortVideoProposal
 
-    def test_equality_comparison(self):
-        """等価性比較のテスト"""
-        proposal1 = ShortVideoProposal(
+    @classmethod
+    def setup_class(cls):
+        """テストで読み取り専用に使い回す企画提案をクラスで1回だけ生成"""
+        cls.base_proposal = ShortVideoProposal(
             title="テスト",
             start_time=0.0,
             end_time=10.0,
             caption="テストキャプション",
             key_points=["ポイント1"],
         )
+
+    @pytest.mark.parametrize("kwargs", PROPOSAL_CASES, ids=["talk", "design-sample"])
+    def test_instance_creation(self, kwargs):
+        """インスタンス生成のテスト"""
+        proposal = ShortVideoProposal(**kwargs)
+
+        for field_name, expected in kwargs.items():
+            assert getattr(proposal, field_name) == expected
+
+    def test_equality_comparison(self):
+        """等価性比較のテスト"""
+        proposal1 = self.base_proposal
         proposal2 = ShortVideoProposal(
             title="テスト",
             start_time=0.0,
@@ -39,31 +80,11 @@ class TestShortVideoProposal:
             caption="テストキャプション",
             key_points=["ポイント1"],
         )
-        proposal3 = ShortVideoProposal(
-            title="別のテスト",
-            start_time=0.0,
-            end_time=10.0,
-            caption="テストキャプション",
-            key_points=["ポイント1"],
-        )
+        proposal3 = replace(self.base_proposal, title="別のテスト")
 
         assert proposal1 == proposal2
         assert proposal1 != proposal3
 
-    def test_string_representation(self):
-        """文字列表現のテスト"""
-        proposal = ShortVideoProposal(
-            title="テスト動画",
-            start_time=0.0,
-            end_time=30.0,
-            caption="テストキャプション",
-            key_points=["ポイント1"],
-        )
-        str_repr = str(proposal)
-
-        assert "ShortVideoProposal" in str_repr
-        assert "テスト動画" in str_repr
-
     def test_time_consistency(self):
         """時刻の論理的整合性のテスト"""
         # 正常なケース
@@ -74,47 +95,20 @@ class TestShortVideoProposal:
         instant_proposal = ShortVideoProposal(title="瞬間", start_time=5.0, end_time=5.0, caption="瞬間的なクリップ", key_points=[])
         assert instant_proposal.start_time == instant_proposal.end_time
 
-    def test_field_types(self):
-        """フィールドの型の正確性のテスト"""
-        proposal = ShortVideoProposal(
-            title="テスト",
-            start_time=0.0,
-            end_time=30.0,
-            caption="テスト",
-            key_points=["ポイント1", "ポイント2"],
-        )
-
-        assert isinstance(proposal.title, str)
-        assert isinstance(proposal.start_time, float)
-        assert isinstance(proposal.end_time, float)
-        assert isinstance(proposal.caption, str)
-        assert isinstance(proposal.key_points, list)
-        assert all(isinstance(point, str) for point in proposal.key_points)
-
-    def test_empty_key_points(self):
-        """空のキーポイントリストのテスト"""
-        proposal = ShortVideoProposal(title="テスト", start_time=0.0, end_time=30.0, caption="テスト", key_points=[])
-
-        assert len(proposal.key_points) == 0
-        assert proposal.key_points == []
-
 
 class TestDraftResult:
     """DraftResultのテストクラス"""
 
-    def setup_method(self):
-        """各テストメソッドの前に実行される準備処理"""
-        self.sample_segments = [TranscriptionSegment(0.0, 10.0, "テスト文字起こし")]
-        self.sample_transcription = TranscriptionResult(segments=self.sample_segments, full_text="テスト文字起こし")
-        self.sample_proposals = [
-            ShortVideoProposal(
-                title="タイトル1",
-                start_time=0.0,
-                end_time=5.0,
-                caption="キャプション1",
-                key_points=["ポイント1"],
-            ),
-        ]
+    sample_segments: list[TranscriptionSegment]
+    sample_transcription: TranscriptionResult
+    sample_proposals: list[ShortVideoProposal]
+
+    @classmethod
+    def setup_class(cls):
+        """テストデータをクラスで1回だけ準備（各テストは読み取りのみで変更しない）"""
+        cls.sample_segments = [TranscriptionSegment(0.0, 10.0, "テスト文字起こし")]
+        cls.sample_transcription = TranscriptionResult(segments=cls.sample_segments, full_text="テスト文字起こし")
+        cls.sample_proposals = [_sample_proposal()]
 
     def test_instance_creation(self):
         """インスタンス生成のテスト"""
@@ -123,8 +117,8 @@ class TestDraftResult:
             original_transcription=self.sample_transcription,
         )
 
-        assert len(draft.proposals) == 1
-        assert draft.original_transcription == self.sample_transcription
+        assert draft.proposals == [_sample_proposal()]
+        assert draft.original_transcription is self.sample_transcription
 
     def test_equality_comparison(self):
         """等価性比較のテスト"""
@@ -154,41 +148,15 @@ class TestDraftResult:
         assert draft1 == draft2
         assert draft1 != draft3
 
-    def test_string_representation(self):
-        """文字列表現のテスト"""
-        draft = DraftResult(
-            proposals=self.sample_proposals,
-            original_transcription=self.sample_transcription,
-        )
-        str_repr = str(draft)
-
-        assert "DraftResult" in str_repr
-
     def test_multiple_proposals(self):
         """複数の企画提案のテスト"""
-        multiple_proposals = [
-            ShortVideoProposal(
-                title="提案1",
-                start_time=0.0,
-                end_time=30.0,
-                caption="キャプション1",
-                key_points=["ポイント1-1", "ポイント1-2"],
-            ),
-            ShortVideoProposal(
-                title="提案2",
-                start_time=30.0,
-                end_time=60.0,
-                caption="キャプション2",
-                key_points=["ポイント2-1"],
-            ),
-            ShortVideoProposal(
-                title="提案3",
-                start_time=60.0,
-                end_time=90.0,
-                caption="キャプション3",
-                key_points=[],
-            ),
-        ]
+        multiple_proposals = _make_proposals(
+            [
+                ("提案1", 0.0, 30.0, "キャプション1", ["ポイント1-1", "ポイント1-2"]),
+                ("提案2", 30.0, 60.0, "キャプション2", ["ポイント2-1"]),
+                ("提案3", 60.0, 90.0, "キャプション3", []),
+            ]
+        )
 
         draft = DraftResult(
             proposals=multiple_proposals,
@@ -200,59 +168,44 @@ class TestDraftResult:
         assert draft.proposals[1].title == "提案2"
         assert draft.proposals[2].title == "提案3"
 
-    def test_empty_proposals(self):
-        """空の企画提案リストのテスト"""
-        draft = DraftResult(proposals=[], original_transcription=self.sample_transcription)
-
-        assert len(draft.proposals) == 0
-        assert draft.proposals == []
-
-    def test_field_types(self):
-        """フィールドの型の正確性のテスト"""
-        draft = DraftResult(
-            proposals=self.sample_proposals,
-            original_transcription=self.sample_transcription,
-        )
 
-        assert isinstance(draft.proposals, list)
-        assert isinstance(draft.original_transcription, TranscriptionResult)
-        assert all(isinstance(proposal, ShortVideoProposal) for proposal in draft.proposals)
+@pytest.mark.parametrize(
+    "obj,expected_substrings",
+    [
+        (_sample_proposal(), ["ShortVideoProposal", "キャプション1"]),
+        (
+            DraftResult([_sample_proposal()], TranscriptionResult([TranscriptionSegment(0.0, 10.0, "テスト文字起こし")], "テスト文字起こし")),
+            ["DraftResult", "タイトル1", "テスト文字起こし"],
+        ),
+    ],
+    ids=["ShortVideoProposal", "DraftResult"],
+)
+def test_string_representation(obj, expected_substrings):
+    """文字列表現のテスト"""
+    str_repr = str(obj)
+
+    for expected in expected_substrings:
+        assert expected in str_repr
+
+
+@pytest.mark.parametrize(
+    "factory,attr",
+    [
+        (lambda: replace(_sample_proposal(), key_points=[]), "key_points"),
+        (lambda: DraftResult(proposals=[], original_transcription=TranscriptionResult([], "")), "proposals"),
+    ],
+    ids=["key_points", "proposals"],
+)
+def test_empty_container(factory, attr):
+    """空のリストを持つインスタンスのテスト"""
+    obj = factory()
+
+    assert getattr(obj, attr) == []
 
 
 class TestSampleData:
     """サンプルデータを使った統合テスト"""
 
-    def test_sample_draft_data(self):
-        """設計書のサンプルデータでのテスト"""
-        # サンプル文字起こしデータ
-        segments = [TranscriptionSegment(0.0, 10.0, "テスト文字起こし")]
-        transcription = TranscriptionResult(segments, "テスト文字起こし")
-
-        # サンプル企画提案データ
-        proposals = [
-            ShortVideoProposal(
-                title="タイトル1",
-                start_time=0.0,
-                end_time=5.0,
-                caption="キャプション1",
-                key_points=["ポイント1"],
-            ),
-        ]
-
-        draft = DraftResult(proposals, transcription)
-
-        # 基本的な検証
-        assert len(draft.proposals) == 1
-        assert draft.original_transcription == transcription
-
-        # 企画提案の内容検証
-        proposal = draft.proposals[0]
-        assert proposal.title == "タイトル1"
-        assert proposal.start_time == 0.0
-        assert proposal.end_time == 5.0
-        assert proposal.caption == "キャプション1"
-        assert proposal.key_points == ["ポイント1"]
-
     def test_realistic_usage_pattern(self):
         """実際の使用パターンに近いテスト"""
         # より現実的な文字起こしデータ
@@ -263,33 +216,28 @@ class TestSampleData:
             TranscriptionSegment(45.0, 60.0, "最後にクラスについて説明します"),
         ]
 
-        full_text = "今日はPythonの基本について説明しますまずは変数の定義から始めましょう次に関数の作り方を見ていきます最後にクラスについて説明します"
-        transcription = TranscriptionResult(segments, full_text)
+        transcription = TranscriptionResult(segments, "".join(segment.text for segment in segments))
 
         # 複数の企画提案
-        proposals = [
-            ShortVideoProposal(
-                title="Python基本講座 - 変数編",
-                start_time=0.0,
-                end_time=30.0,
-                caption="Pythonの変数について分かりやすく解説！ #Python #プログラミング初心者",
-                key_points=["変数の基本概念", "変数の定義方法", "実際のコード例"],
-            ),
-            ShortVideoProposal(
-                title="Python基本講座 - 関数編",
-                start_time=15.0,
-                end_time=45.0,
-                caption="関数の作り方をマスターしよう！ #Python #関数",
-                key_points=["関数の定義", "引数と戻り値", "実践的な使い方"],
-            ),
-            ShortVideoProposal(
-                title="Python基本講座 - クラス編",
-                start_time=30.0,
-                end_time=60.0,
-                caption="オブジェクト指向プログラミングの基礎 #Python #OOP",
-                key_points=["クラスの概念", "インスタンスの作成", "メソッドの定義"],
-            ),
-        ]
+        proposals = _make_proposals(
+            [
+                (
+                    "Python基本講座 - 変数編",
+                    0.0,
+                    30.0,
+                    "Pythonの変数について分かりやすく解説！ #Python #プログラミング初心者",
+                    ["変数の基本概念", "変数の定義方法", "実際のコード例"],
+                ),
+                ("Python基本講座 - 関数編", 15.0, 45.0, "関数の作り方をマスターしよう！ #Python #関数", ["関数の定義", "引数と戻り値", "実践的な使い方"]),
+                (
+                    "Python基本講座 - クラス編",
+                    30.0,
+                    60.0,
+                    "オブジェクト指向プログラミングの基礎 #Python #OOP",
+                    ["クラスの概念", "インスタンスの作成", "メソッドの定義"],
+                ),
+            ]
+        )
 
         draft = DraftResult(proposals, transcription)
 
@@ -299,10 +247,11 @@ class TestSampleData:
 
         # 各提案の時間範囲が元の文字起こし範囲内にあることを確認
         total_duration = transcription.segments[-1].end_time
-        for proposal in draft.proposals:
-            assert 0.0 <= proposal.start_time <= total_duration
-            assert 0.0 <= proposal.end_time <= total_duration
-            assert proposal.start_time <= proposal.end_time
+        start_times = tuple(proposal.start_time for proposal in draft.proposals)
+        end_times = tuple(proposal.end_time for proposal in draft.proposals)
+        assert min(start_times) >= 0.0
+        assert max(end_times) <= total_duration
+        assert all(start <= end for start, end in zip(start_times, end_times, strict=True))
 
         # キーポイントの内容確認
         assert len(draft.proposals[0].key_points) == 3
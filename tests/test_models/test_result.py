@@ -4,6 +4,26 @@ import pytest
 
 from src.models.result import GenerateResult
 
+# 深い階層の出力パス
+LONG_OUTPUT_DIR = "very/long/path/to/output/directory/with/many/subdirectories"
+LONG_DRAFT_PATH = f"{LONG_OUTPUT_DIR}/draft.md"
+LONG_SUBTITLE_PATH = f"{LONG_OUTPUT_DIR}/subtitle.srt"
+
+# 実際の使用パターンに近い成功例（企画書ファイルパス, 字幕ファイルパス）
+SUCCESS_CASES = [
+    ("output/2025-01-10_draft.md", "output/2025-01-10_subtitle.srt"),
+    ("/tmp/shortmovie/draft_001.md", "/tmp/shortmovie/subtitle_001.srt"),
+    ("C:\\Users\\user\\Documents\\output\\draft.md", "C:\\Users\\user\\Documents\\output\\subtitle.srt"),
+]
+
+# 実際の使用パターンに近い失敗例（エラーメッセージ）
+FAILURE_CASES = [
+    "OpenAI APIキーが設定されていません",
+    "入力動画ファイルが見つかりません",
+    "ネットワークエラーが発生しました",
+    "出力ディレクトリへの書き込み権限がありません",
+]
+
 
 class TestGenerateResult:
     """GenerateResultのテストクラス"""
@@ -89,20 +109,6 @@ class TestGenerateResult:
         )
         assert failure_result.success is False
 
-    def test_field_types(self):
-        """フィールドの型の正確性のテスト"""
-        result = GenerateResult(
-            draft_file_path="output/draft.md",
-            subtitle_file_path="output/subtitle.srt",
-            success=True,
-            error_message=None,
-        )
-
-        assert isinstance(result.draft_file_path, str)
-        assert isinstance(result.subtitle_file_path, str)
-        assert isinstance(result.success, bool)
-        assert result.error_message is None or isinstance(result.error_message, str)
-
     def test_optional_error_message(self):
         """オプショナルなエラーメッセージのテスト"""
         # エラーメッセージなし（デフォルト）
@@ -147,17 +153,14 @@ class TestGenerateResult:
 
     def test_long_file_paths(self):
         """長いファイルパスのテスト"""
-        long_draft_path = "very/long/path/to/output/directory/with/many/subdirectories/draft.md"
-        long_subtitle_path = "very/long/path/to/output/directory/with/many/subdirectories/subtitle.srt"
-
         result = GenerateResult(
-            draft_file_path=long_draft_path,
-            subtitle_file_path=long_subtitle_path,
+            draft_file_path=LONG_DRAFT_PATH,
+            subtitle_file_path=LONG_SUBTITLE_PATH,
             success=True,
         )
 
-        assert result.draft_file_path == long_draft_path
-        assert result.subtitle_file_path == long_subtitle_path
+        assert result.draft_file_path == LONG_DRAFT_PATH
+        assert result.subtitle_file_path == LONG_SUBTITLE_PATH
         assert result.success is True
 
 
@@ -204,43 +207,25 @@ class TestSampleData:
             assert error_result.error_message is not None
             assert error_result.error_message != ""
 
-    @pytest.mark.parametrize(
-        "draft_file_path,subtitle_file_path,success,error_message",
-        [
-            # 成功パターン
-            ("output/2025-01-10_draft.md", "output/2025-01-10_subtitle.srt", True, None),
-            ("/tmp/shortmovie/draft_001.md", "/tmp/shortmovie/subtitle_001.srt", True, None),
-            ("C:\\Users\\user\\Documents\\output\\draft.md", "C:\\Users\\user\\Documents\\output\\subtitle.srt", True, None),
-            # 失敗パターン
-            ("", "", False, "OpenAI APIキーが設定されていません"),
-            ("", "", False, "入力動画ファイルが見つかりません"),
-            ("", "", False, "ネットワークエラーが発生しました"),
-            ("", "", False, "出力ディレクトリへの書き込み権限がありません"),
-        ],
-    )
-    def test_realistic_usage_patterns(self, draft_file_path: str, subtitle_file_path: str, success: bool, error_message: str | None):
-        """実際の使用パターンに近いテスト"""
-        result = GenerateResult(
-            draft_file_path=draft_file_path,
-            subtitle_file_path=subtitle_file_path,
-            success=success,
-            error_message=error_message,
-        )
+    @pytest.mark.parametrize("draft_file_path,subtitle_file_path", SUCCESS_CASES)
+    def test_realistic_success_patterns(self, draft_file_path: str, subtitle_file_path: str):
+        """実際の使用パターンに近い成功時のテスト"""
+        result = GenerateResult(draft_file_path=draft_file_path, subtitle_file_path=subtitle_file_path, success=True)
 
-        assert result.success == success
-        assert result.error_message == error_message
+        assert result.success is True
+        assert result.error_message is None
         assert result.draft_file_path == draft_file_path
         assert result.subtitle_file_path == subtitle_file_path
 
-        if success:
-            assert result.error_message is None
-            assert result.draft_file_path != ""
-            assert result.subtitle_file_path != ""
-        else:
-            assert result.error_message is not None
-            assert result.error_message != ""
-            assert result.draft_file_path == ""
-            assert result.subtitle_file_path == ""
+    @pytest.mark.parametrize("error_message", FAILURE_CASES)
+    def test_realistic_failure_patterns(self, error_message: str):
+        """実際の使用パターンに近い失敗時のテスト"""
+        result = GenerateResult(draft_file_path="", subtitle_file_path="", success=False, error_message=error_message)
+
+        assert result.success is False
+        assert result.error_message == error_message
+        assert result.draft_file_path == ""
+        assert result.subtitle_file_path == ""
 
     def test_partial_success_scenarios(self):
         """部分的成功シナリオのテスト"""
@@ -1,18 +1,27 @@
 """transcription.pyのテスト"""
 
+import pytest
+
 from src.models.transcription import TranscriptionResult, TranscriptionSegment
 
+# 設計書のサンプルデータ（start_time, end_time, text）
+SAMPLE_SEGMENT_VALUES = [
+    (0.0, 3.5, "こんにちは、今日は"),
+    (3.5, 7.2, "ショート動画について話します"),
+]
+
 
 class TestTranscriptionSegment:
     """TranscriptionSegmentのテストクラス"""
 
-    def test_instance_creation(self):
+    @pytest.mark.parametrize("start_time,end_time,text", SAMPLE_SEGMENT_VALUES)
+    def test_instance_creation(self, start_time, end_time, text):
         """インスタンス生成のテスト"""
-        segment = TranscriptionSegment(0.0, 3.5, "こんにちは、今日は")
+        segment = TranscriptionSegment(start_time, end_time, text)
 
-        assert segment.start_time == 0.0
-        assert segment.end_time == 3.5
-        assert segment.text == "こんにちは、今日は"
+        assert segment.start_time == start_time
+        assert segment.end_time == end_time
+        assert segment.text == text
 
     def test_equality_comparison(self):
         """等価性比較のテスト"""
@@ -21,50 +30,30 @@ class TestTranscriptionSegment:
         segment3 = TranscriptionSegment(3.5, 7.2, "ショート動画について話します")
 
         assert segment1 == segment2
+        assert hash(segment1) == hash(segment2)
         assert segment1 != segment3
 
-    def test_string_representation(self):
-        """文字列表現のテスト"""
-        segment = TranscriptionSegment(0.0, 3.5, "こんにちは、今日は")
-        str_repr = str(segment)
-
-        assert "TranscriptionSegment" in str_repr
-        assert "0.0" in str_repr
-        assert "3.5" in str_repr
-        assert "こんにちは、今日は" in str_repr
-
-    def test_time_consistency(self):
+    def test_time_consistency(self, sample_segment):
         """時刻の論理的整合性のテスト"""
         # 正常なケース
-        segment = TranscriptionSegment(0.0, 3.5, "テスト")
-        assert segment.start_time < segment.end_time
+        assert sample_segment.start_time < sample_segment.end_time
 
         # 同じ時刻のケース（瞬間的な発話）
         instant_segment = TranscriptionSegment(1.0, 1.0, "")
         assert instant_segment.start_time == instant_segment.end_time
 
-    def test_field_types(self):
-        """フィールドの型の正確性のテスト"""
-        segment = TranscriptionSegment(0.0, 3.5, "テスト")
-
-        assert isinstance(segment.start_time, float)
-        assert isinstance(segment.end_time, float)
-        assert isinstance(segment.text, str)
-
 
 class TestTranscriptionResult:
     """TranscriptionResultのテストクラス"""
 
     def test_instance_creation(self):
         """インスタンス生成のテスト"""
-        segments = [
-            TranscriptionSegment(0.0, 3.5, "こんにちは、今日は"),
-            TranscriptionSegment(3.5, 7.2, "ショート動画について話します"),
-        ]
+        segments = [TranscriptionSegment(*values) for values in SAMPLE_SEGMENT_VALUES]
         result = TranscriptionResult(segments=segments, full_text="こんにちは、今日はショート動画について話します")
 
         assert len(result.segments) == 2
         assert result.full_text == "こんにちは、今日はショート動画について話します"
+        assert result.segments[0].end_time == result.segments[1].start_time
 
     def test_equality_comparison(self):
         """等価性比較のテスト"""
@@ -79,15 +68,6 @@ class TestTranscriptionResult:
         assert result1 == result2
         assert result1 != result3
 
-    def test_string_representation(self):
-        """文字列表現のテスト"""
-        segments = [TranscriptionSegment(0.0, 3.5, "テスト")]
-        result = TranscriptionResult(segments, "テスト")
-        str_repr = str(result)
-
-        assert "TranscriptionResult" in str_repr
-        assert "テスト" in str_repr
-
     def test_empty_segments(self):
         """空のセグメントリストのテスト"""
         result = TranscriptionResult(segments=[], full_text="")
@@ -95,46 +75,26 @@ class TestTranscriptionResult:
         assert len(result.segments) == 0
         assert result.full_text == ""
 
-    def test_field_types(self):
-        """フィールドの型の正確性のテスト"""
-        segments = [TranscriptionSegment(0.0, 3.5, "テスト")]
-        result = TranscriptionResult(segments, "テスト")
 
-        assert isinstance(result.segments, list)
-        assert isinstance(result.full_text, str)
-        assert all(isinstance(seg, TranscriptionSegment) for seg in result.segments)
+@pytest.mark.parametrize(
+    "obj,expected_substrings",
+    [
+        (TranscriptionSegment(0.0, 3.5, "こんにちは、今日は"), ["TranscriptionSegment", "0.0", "3.5", "こんにちは、今日は"]),
+        (TranscriptionResult([TranscriptionSegment(0.0, 3.5, "テスト")], "テスト"), ["TranscriptionResult", "テスト"]),
+    ],
+    ids=["TranscriptionSegment", "TranscriptionResult"],
+)
+def test_string_representation(obj, expected_substrings):
+    """文字列表現のテスト"""
+    str_repr = str(obj)
+
+    for expected in expected_substrings:
+        assert expected in str_repr
 
 
 class TestSampleData:
     """サンプルデータを使った統合テスト"""
 
-    def test_sample_transcription_data(self):
-        """設計書のサンプルデータでのテスト"""
-        sample_segments = [
-            TranscriptionSegment(0.0, 3.5, "こんにちは、今日は"),
-            TranscriptionSegment(3.5, 7.2, "ショート動画について話します"),
-        ]
-
-        sample_transcription = TranscriptionResult(segments=sample_segments, full_text="こんにちは、今日はショート動画について話します")
-
-        # 基本的な検証
-        assert len(sample_transcription.segments) == 2
-        assert sample_transcription.full_text == "こんにちは、今日はショート動画について話します"
-
-        # セグメントの内容検証
-        first_segment = sample_transcription.segments[0]
-        assert first_segment.start_time == 0.0
-        assert first_segment.end_time == 3.5
-        assert first_segment.text == "こんにちは、今日は"
-
-        second_segment = sample_transcription.segments[1]
-        assert second_segment.start_time == 3.5
-        assert second_segment.end_time == 7.2
-        assert second_segment.text == "ショート動画について話します"
-
-        # 時系列の整合性確認
-        assert first_segment.end_time == second_segment.start_time
-
     def test_realistic_usage_pattern(self):
         """実際の使用パターンに近いテスト"""
         # より長い文字起こし結果をシミュレート
@@ -152,13 +112,12 @@ class TestSampleData:
 
         # 全体の検証
         assert len(transcription.segments) == 5
-        assert transcription.full_text == full_text
+        assert transcription.full_text is full_text
 
         # 時系列の連続性確認
-        for i in range(len(segments) - 1):
-            current_segment = transcription.segments[i]
-            next_segment = transcription.segments[i + 1]
-            assert current_segment.end_time == next_segment.start_time
+        end_times = tuple(segment.end_time for segment in transcription.segments[:-1])
+        start_times = tuple(segment.start_time for segment in transcription.segments[1:])
+        assert end_times == start_times
 
         # 全体の時間範囲確認
         total_duration = transcription.segments[-1].end_time - transcription.segments[0].start_time
@@ -1,13 +1,11 @@
 """DraftGeneratorのテスト"""
 
+import json
 import os
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock
 
 import pytest
 
-from src.builders.prompt_builder import PromptBuilder
-from src.clients.chatgpt_client import ChatGPTClient
-from src.clients.whisper_client import WhisperClient
 from src.models.draft import DraftResult, ShortVideoProposal
 from src.models.hooks import DetailedScript, HookItem
 from src.models.transcription import TranscriptionResult, TranscriptionSegment
@@ -17,6 +15,28 @@ from src.service.draft_generator import (
     TranscriptionError,
 )
 
+# テスト間で共有するサンプルデータ（各テストでは読み取りのみ行い、変更しないこと）
+SAMPLE_TRANSCRIPTION = TranscriptionResult(
+    segments=[
+        TranscriptionSegment(0.0, 5.0, "こんにちは"),
+        TranscriptionSegment(5.0, 10.0, "今日は良い天気ですね"),
+    ],
+    full_text="こんにちは今日は良い天気ですね",
+)
+
+# SAMPLE_TRANSCRIPTIONを保存した際のJSONの内容
+SAMPLE_TRANSCRIPTION_DATA = {
+    "full_text": "こんにちは今日は良い天気ですね",
+    "segments": [
+        {"start_time": 0.0, "end_time": 5.0, "text": "こんにちは"},
+        {"start_time": 5.0, "end_time": 10.0, "text": "今日は良い天気ですね"},
+    ],
+}
+
+SAMPLE_HOOK = HookItem(first_hook="テストフック1", second_hook="テストフック2", third_hook="テストフック3", summary="テスト要約")
+
+SAMPLE_SCRIPT = DetailedScript(hook_item=SAMPLE_HOOK, script_content="テスト台本内容", duration_seconds=60, segments_used=SAMPLE_TRANSCRIPTION.segments)
+
 
 class TestDraftGenerator:
     """DraftGeneratorのテストクラス"""
@@ -33,45 +53,23 @@ class TestDraftGenerator:
             prompt_builder=self.mock_prompt_builder,
         )
 
-        self.sample_transcription = TranscriptionResult(
-            segments=[
-                TranscriptionSegment(0.0, 5.0, "こんにちは"),
-                TranscriptionSegment(5.0, 10.0, "今日は良い天気ですね"),
-            ],
-            full_text="こんにちは今日は良い天気ですね",
-        )
-
-        self.sample_proposals = [
-            ShortVideoProposal(
-                title="テストタイトル",
-                start_time=0.0,
-                end_time=10.0,
-                caption="テストキャプション",
-                key_points=["ポイント1", "ポイント2"],
-            ),
-        ]
-
     def test_init(self):
         """初期化のテスト"""
         assert self.generator.whisper_client == self.mock_whisper_client
         assert self.generator.chatgpt_client == self.mock_chatgpt_client
         assert self.generator.prompt_builder == self.mock_prompt_builder
 
-    @patch("src.service.draft_generator.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
-    def test_transcribe_video_success(self, mock_json_dump, mock_file, mock_path):
+    def test_transcribe_video_success(self, tmp_path):
         """正常な動画文字起こしのテスト"""
-        mock_path.return_value.mkdir = Mock()
-        mock_path.return_value.stem = "test_video"
+        self.mock_whisper_client.transcribe.return_value = SAMPLE_TRANSCRIPTION
+        output_dir = tmp_path / "output"
 
-        self.mock_whisper_client.transcribe.return_value = self.sample_transcription
+        result = self.generator.transcribe_video("test_video.mp4", str(output_dir))
 
-        result = self.generator.transcribe_video("test_video.mp4", "output/")
-
-        assert result == self.sample_transcription
+        assert result == SAMPLE_TRANSCRIPTION
         self.mock_whisper_client.transcribe.assert_called_once_with("test_video.mp4")
-        mock_json_dump.assert_called_once()
+        saved = json.loads((output_dir / "test_video_transcription.json").read_text(encoding="utf-8"))
+        assert saved == SAMPLE_TRANSCRIPTION_DATA
 
     def test_transcribe_video_error(self):
         """動画文字起こしエラーのテスト"""
@@ -83,27 +81,18 @@ class TestDraftGenerator:
     def test_generate_draft_success(self):
         """正常な企画書生成のテスト（2段階処理）"""
         # 2段階処理のモック設定
-
-        # フック抽出のモック
-        sample_hook = HookItem(first_hook="テストフック1", second_hook="テストフック2", third_hook="テストフック3", summary="テスト要約")
-
-        # 詳細台本のモック
-        sample_script = DetailedScript(
-            hook_item=sample_hook, script_content="テスト台本内容", duration_seconds=60, segments_used=self.sample_transcription.segments
-        )
-
         self.mock_prompt_builder.build_hooks_prompt.return_value = "hooks prompt"
-        self.mock_chatgpt_client.extract_hooks.return_value = [sample_hook]
-        self.mock_chatgpt_client.generate_detailed_scripts_parallel.return_value = [sample_script]
+        self.mock_chatgpt_client.extract_hooks.return_value = [SAMPLE_HOOK]
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.return_value = [SAMPLE_SCRIPT]
 
-        result = self.generator.generate_draft(self.sample_transcription)
+        result = self.generator.generate_draft(SAMPLE_TRANSCRIPTION)
 
         assert isinstance(result, DraftResult)
         assert len(result.proposals) == 1
         assert result.proposals[0].title == "テストフック1"
-        assert result.original_transcription == self.sample_transcription
+        assert result.original_transcription == SAMPLE_TRANSCRIPTION
 
-        self.mock_prompt_builder.build_hooks_prompt.assert_called_once_with(self.sample_transcription)
+        self.mock_prompt_builder.build_hooks_prompt.assert_called_once_with(SAMPLE_TRANSCRIPTION)
         self.mock_chatgpt_client.extract_hooks.assert_called_once_with("hooks prompt")
 
     def test_generate_draft_error(self):
@@ -111,90 +100,58 @@ class TestDraftGenerator:
         self.mock_prompt_builder.build_hooks_prompt.side_effect = Exception("Prompt Error")
 
         with pytest.raises(DraftGenerationError, match="企画書の生成に失敗しました"):
-            self.generator.generate_draft(self.sample_transcription)
+            self.generator.generate_draft(SAMPLE_TRANSCRIPTION)
 
-    @patch("src.service.draft_generator.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
-    def test_generate_from_video_success(self, mock_json_dump, mock_file, mock_path):
+    def test_generate_from_video_success(self, tmp_path):
         """動画から直接企画書生成の成功テスト"""
-        mock_path.return_value.mkdir = Mock()
-        mock_path.return_value.stem = "test_video"
-
         # 2段階処理のモック設定
-
-        sample_hook = HookItem(first_hook="テストフック1", second_hook="テストフック2", third_hook="テストフック3", summary="テスト要約")
-
-        sample_script = DetailedScript(
-            hook_item=sample_hook, script_content="テスト台本内容", duration_seconds=60, segments_used=self.sample_transcription.segments
-        )
-
-        self.mock_whisper_client.transcribe.return_value = self.sample_transcription
+        self.mock_whisper_client.transcribe.return_value = SAMPLE_TRANSCRIPTION
         self.mock_prompt_builder.build_hooks_prompt.return_value = "test prompt"
-        self.mock_chatgpt_client.extract_hooks.return_value = [sample_hook]
-        self.mock_chatgpt_client.generate_detailed_scripts_parallel.return_value = [sample_script]
+        self.mock_chatgpt_client.extract_hooks.return_value = [SAMPLE_HOOK]
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.return_value = [SAMPLE_SCRIPT]
 
-        result = self.generator.generate_from_video("test_video.mp4", "output/")
+        result = self.generator.generate_from_video("test_video.mp4", str(tmp_path))
 
         assert isinstance(result, DraftResult)
         assert len(result.proposals) == 1
         assert result.proposals[0].title == "テストフック1"
-        assert result.original_transcription == self.sample_transcription
+        assert result.original_transcription == SAMPLE_TRANSCRIPTION
 
-    @patch("os.path.exists")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.load")
-    def test_load_transcription_success(self, mock_json_load, mock_file, mock_exists):
+    def test_load_transcription_success(self, tmp_path):
         """文字起こし結果読み込み成功のテスト"""
-        mock_exists.return_value = True
-        mock_json_load.return_value = {
-            "full_text": "こんにちは今日は良い天気ですね",
-            "segments": [
-                {"start_time": 0.0, "end_time": 5.0, "text": "こんにちは"},
-                {"start_time": 5.0, "end_time": 10.0, "text": "今日は良い天気ですね"},
-            ],
-        }
+        transcription_file = tmp_path / "transcription.json"
+        transcription_file.write_text(json.dumps(SAMPLE_TRANSCRIPTION_DATA, ensure_ascii=False), encoding="utf-8")
 
-        result = self.generator.load_transcription("transcription.json")
+        result = self.generator.load_transcription(str(transcription_file))
 
         assert isinstance(result, TranscriptionResult)
         assert result.full_text == "こんにちは今日は良い天気ですね"
         assert len(result.segments) == 2
         assert result.segments[0].text == "こんにちは"
 
-    @patch("os.path.exists")
-    def test_load_transcription_file_not_found(self, mock_exists):
-        """文字起こし結果読み込みファイル未存在のテスト"""
-        mock_exists.return_value = False
+    def test_save_and_load_transcription_roundtrip(self, tmp_path):
+        """保存した文字起こし結果を読み込むと元の内容に戻るテスト"""
+        transcription_file = self.generator._save_transcription(SAMPLE_TRANSCRIPTION, "test_video.mp4", str(tmp_path))
 
+        assert transcription_file == str(tmp_path / "test_video_transcription.json")
+        assert self.generator.load_transcription(transcription_file) == SAMPLE_TRANSCRIPTION
+        # 日本語はエスケープせずに保存される
+        assert "こんにちは" in (tmp_path / "test_video_transcription.json").read_text(encoding="utf-8")
+
+    def test_load_transcription_file_not_found(self, tmp_path):
+        """文字起こし結果読み込みファイル未存在のテスト"""
         with pytest.raises(FileNotFoundError, match="文字起こしファイルが見つかりません"):
-            self.generator.load_transcription("nonexistent.json")
+            self.generator.load_transcription(str(tmp_path / "nonexistent.json"))
 
     def test_serialize_transcription(self):
         """文字起こし結果シリアライズのテスト"""
-        result = self.generator._serialize_transcription(self.sample_transcription)
+        result = self.generator._serialize_transcription(SAMPLE_TRANSCRIPTION)
 
-        expected = {
-            "full_text": "こんにちは今日は良い天気ですね",
-            "segments": [
-                {"start_time": 0.0, "end_time": 5.0, "text": "こんにちは"},
-                {"start_time": 5.0, "end_time": 10.0, "text": "今日は良い天気ですね"},
-            ],
-        }
-
-        assert result == expected
+        assert result == SAMPLE_TRANSCRIPTION_DATA
 
     def test_deserialize_transcription(self):
         """文字起こし結果デシリアライズのテスト"""
-        data = {
-            "full_text": "こんにちは今日は良い天気ですね",
-            "segments": [
-                {"start_time": 0.0, "end_time": 5.0, "text": "こんにちは"},
-                {"start_time": 5.0, "end_time": 10.0, "text": "今日は良い天気ですね"},
-            ],
-        }
-
-        result = self.generator._deserialize_transcription(data)
+        result = self.generator._deserialize_transcription(SAMPLE_TRANSCRIPTION_DATA)
 
         assert isinstance(result, TranscriptionResult)
         assert result.full_text == "こんにちは今日は良い天気ですね"
@@ -203,24 +160,15 @@ class TestDraftGenerator:
         assert result.segments[1].text == "今日は良い天気ですね"
 
 
+@pytest.mark.slow
 @pytest.mark.integration
+@pytest.mark.skipif(not os.getenv("INTEGRATION_TEST"), reason="統合テストはINTEGRATION_TEST=trueの場合のみ実行")
 class TestDraftGeneratorIntegration:
     """DraftGeneratorの統合テスト"""
 
-    def test_full_workflow_integration(self):
+    def test_full_workflow_integration(self, openai_clients):
         """完全なワークフローの統合テスト"""
-        if not os.getenv("INTEGRATION_TEST"):
-            pytest.skip("統合テストはINTEGRATION_TEST=trueの場合のみ実行")
-
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            pytest.skip("OPENAI_API_KEYが設定されていません")
-
-        whisper_client = WhisperClient(api_key)
-        chatgpt_client = ChatGPTClient(api_key)
-        prompt_builder = PromptBuilder()
-
-        generator = DraftGenerator(whisper_client, chatgpt_client, prompt_builder)
+        generator = DraftGenerator(*openai_clients)
 
         sample_transcription = TranscriptionResult(
             segments=[
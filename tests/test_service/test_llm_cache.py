@@ -0,0 +1,40 @@
+"""LLMCacheのテスト"""
+
+from src.service.llm_cache import LLMCache
+
+
+class TestLLMCache:
+    """LLMCacheのテストクラス"""
+
+    def test_make_key_is_deterministic(self, tmp_path):
+        """同じ入力からは同じキーが生成されるテスト"""
+        cache = LLMCache(str(tmp_path))
+
+        key1 = cache.make_key(phase="hooks", model="gpt-4o", prompt="テスト")
+        key2 = cache.make_key(prompt="テスト", model="gpt-4o", phase="hooks")
+
+        assert key1 == key2
+        assert key1 != cache.make_key(phase="hooks", model="gpt-4o-mini", prompt="テスト")
+
+    def test_get_missing_key(self, tmp_path):
+        """存在しないキーの取得テスト"""
+        cache = LLMCache(str(tmp_path))
+
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self, tmp_path):
+        """保存した値を取得できるテスト"""
+        cache = LLMCache(str(tmp_path / "cache"))
+        value = [{"first_hook": "フック1", "summary": "要約"}]
+
+        cache.set("key", value)
+
+        assert cache.get("key") == value
+        assert [p.name for p in (tmp_path / "cache").iterdir()] == ["key.json"]
+
+    def test_get_corrupted_file(self, tmp_path):
+        """壊れたキャッシュファイルはキャッシュなしとして扱うテスト"""
+        cache = LLMCache(str(tmp_path))
+        (tmp_path / "key.json").write_text("{invalid", encoding="utf-8")
+
+        assert cache.get("key") is None
@@ -1,13 +1,22 @@
 """SrtGeneratorのテスト"""
 
-import os  # noqa: F401
-from unittest.mock import mock_open, patch
+import os
+from unittest.mock import patch
 
 import pytest
 
 from src.models.transcription import TranscriptionResult, TranscriptionSegment
 from src.service.srt_generator import SrtGenerationError, SrtGenerator
 
+# テスト間で共有するサンプルデータ（各テストでは読み取りのみ行い、変更しないこと）
+SAMPLE_TRANSCRIPTION = TranscriptionResult(
+    segments=[
+        TranscriptionSegment(0.0, 5.0, "こんにちは"),
+        TranscriptionSegment(5.0, 10.0, "今日は良い天気ですね"),
+    ],
+    full_text="こんにちは今日は良い天気ですね",
+)
+
 
 class TestSrtGenerator:
     """SrtGeneratorのテストクラス"""
@@ -16,27 +25,29 @@ class TestSrtGenerator:
         """各テストメソッドの前に実行される初期化"""
         self.generator = SrtGenerator()
 
-        self.sample_transcription = TranscriptionResult(
-            segments=[
-                TranscriptionSegment(0.0, 5.0, "こんにちは"),
-                TranscriptionSegment(5.0, 10.0, "今日は良い天気ですね"),
-            ],
-            full_text="こんにちは今日は良い天気ですね",
-        )
-
     def test_init(self):
         """初期化のテスト"""
         assert isinstance(self.generator, SrtGenerator)
 
-    def test_format_seconds_to_srt_time(self):
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (3661.5, "01:01:01,500"),
+            (90.123, "00:01:30,123"),
+            (30.0, "00:00:30,000"),
+            (0.0, "00:00:00,000"),
+            # 浮動小数点誤差でミリ秒が切り捨てられないこと
+            (2.675, "00:00:02,675"),
+            (59.9999, "00:01:00,000"),
+        ],
+    )
+    def test_format_seconds_to_srt_time(self, seconds, expected):
         """秒数からSRT時刻形式への変換テスト"""
-        assert self.generator.format_seconds_to_srt_time(3661.5) == "01:01:01,500"
-        assert self.generator.format_seconds_to_srt_time(90.123) == "00:01:30,123"
-        assert self.generator.format_seconds_to_srt_time(30.0) == "00:00:30,000"
+        assert self.generator.format_seconds_to_srt_time(seconds) == expected
 
     def test_build_srt_content(self):
         """SRT内容構築のテスト"""
-        content = self.generator.build_srt_content(self.sample_transcription)
+        content = self.generator.build_srt_content(SAMPLE_TRANSCRIPTION)
 
         expected_lines = [
             "1",
@@ -51,39 +62,45 @@ class TestSrtGenerator:
 
         assert content == "\n".join(expected_lines)
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("os.makedirs")
-    @patch("os.path.exists")
-    @patch("os.path.dirname")
-    def test_generate_srt_file_success(self, mock_dirname, mock_exists, mock_makedirs, mock_file):
+    def test_build_srt_content_many_segments(self):
+        """長時間の文字起こし（1万セグメント）でもブロックの番号と時刻が崩れないテスト"""
+        segment_count = 10_000
+        transcription = TranscriptionResult(
+            segments=[TranscriptionSegment(float(i), float(i + 1), f"テキスト{i}") for i in range(segment_count)],
+            full_text="",
+        )
+
+        content = self.generator.build_srt_content(transcription)
+        blocks = content.split("\n\n")
+
+        assert len(blocks) == segment_count
+        assert blocks[0] == "1\n00:00:00,000 --> 00:00:01,000\nテキスト0"
+        assert blocks[-1] == "10000\n02:46:39,000 --> 02:46:40,000\nテキスト9999\n"
+
+    def test_generate_srt_file_success(self, tmp_path):
         """SRTファイル生成成功のテスト"""
-        mock_dirname.return_value = "output"
-        mock_exists.return_value = True
+        output_file_path = str(tmp_path / "subtitle.srt")
 
-        result = self.generator.generate_srt_file(self.sample_transcription, "output/subtitle.srt")
+        result = self.generator.generate_srt_file(SAMPLE_TRANSCRIPTION, output_file_path)
 
-        assert result == "output/subtitle.srt"
-        mock_file.assert_called_once_with("output/subtitle.srt", "w", encoding="utf-8")
-        mock_file().write.assert_called_once()
+        assert result == output_file_path
         # 書き込まれた内容を検証
-        written_content = mock_file().write.call_args[0][0]
+        with open(output_file_path, encoding="utf-8", newline="") as f:
+            written_content = f.read()
+        assert written_content == self.generator.build_srt_content(SAMPLE_TRANSCRIPTION)
         assert "00:00:00,000 --> 00:00:05,000" in written_content
         assert "こんにちは" in written_content
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("os.makedirs")
-    @patch("os.path.exists")
-    @patch("os.path.dirname")
-    def test_generate_srt_file_create_directory(self, mock_dirname, mock_exists, mock_makedirs, mock_file):
+    def test_generate_srt_file_create_directory(self, tmp_path):
         """出力ディレクトリが存在しない場合のテスト"""
-        mock_dirname.return_value = "output"
-        mock_exists.return_value = False
+        output_dir = tmp_path / "output" / "nested"
+        output_file_path = str(output_dir / "subtitle.srt")
 
-        result = self.generator.generate_srt_file(self.sample_transcription, "output/subtitle.srt")
+        result = self.generator.generate_srt_file(SAMPLE_TRANSCRIPTION, output_file_path)
 
-        assert result == "output/subtitle.srt"
-        mock_makedirs.assert_called_once_with("output", exist_ok=True)
-        mock_file.assert_called_once_with("output/subtitle.srt", "w", encoding="utf-8")
+        assert result == output_file_path
+        assert output_dir.is_dir()
+        assert os.path.isfile(output_file_path)
 
     @patch("builtins.open")
     def test_generate_srt_file_error(self, mock_open):
@@ -91,7 +108,7 @@ class TestSrtGenerator:
         mock_open.side_effect = OSError("テストエラー")
 
         with pytest.raises(SrtGenerationError) as excinfo:
-            self.generator.generate_srt_file(self.sample_transcription, "output/subtitle.srt")
+            self.generator.generate_srt_file(SAMPLE_TRANSCRIPTION, "output/subtitle.srt")
 
         assert "字幕ファイルの生成に失敗しました" in str(excinfo.value)
         assert "テストエラー" in str(excinfo.value)
@@ -1,10 +1,15 @@
 """GoogleDriveBatchProcessUsecaseのテスト"""
 
+import threading
+from datetime import datetime
 from unittest.mock import Mock, patch
 
+import pytest
+
+from src.clients.google_drive_client import GoogleDriveError
 from src.models.drive import DriveFile, DriveFolder
 from src.models.usecase_results import TranscriptToDraftResult, VideoToTranscriptResult
-from src.usecases.google_drive_batch_process_usecase import GoogleDriveBatchProcessUsecase
+from src.usecases.google_drive_batch_process_usecase import JST, UPLOAD_MAX_WORKERS, GoogleDriveBatchProcessUsecase
 
 
 class TestGoogleDriveBatchProcessUsecase:
@@ -15,6 +20,8 @@ class TestGoogleDriveBatchProcessUsecase:
         self.mock_video_to_transcript_usecase = Mock()
         self.mock_transcript_to_draft_usecase = Mock()
         self.mock_google_drive_client = Mock()
+        self.mock_google_drive_client.find_files_by_name.return_value = []
+        self.mock_google_drive_client.find_folder_id.return_value = None
         self.usecase = GoogleDriveBatchProcessUsecase(
             self.mock_video_to_transcript_usecase, self.mock_transcript_to_draft_usecase, self.mock_google_drive_client
         )
@@ -24,7 +31,6 @@ class TestGoogleDriveBatchProcessUsecase:
         video_file = DriveFile(name="test_video.mp4", file_id="file123", download_url="url", mime_type="video/mp4", size=1024)
         self.usecase._find_unprocessed_video_from_drive = Mock(return_value=video_file)  # type: ignore[method-assign]
         self.mock_google_drive_client.extract_folder_id.return_value = "output_folder_id"
-        self.mock_google_drive_client.folder_exists.return_value = False
         self.mock_google_drive_client.create_folder.return_value = "subfolder_id"
         self.mock_google_drive_client.download_file.return_value = "/tmp/test_video.mp4"
 
@@ -36,7 +42,14 @@ class TestGoogleDriveBatchProcessUsecase:
         draft_result = TranscriptToDraftResult(success=True, draft_file_path="/tmp/draft.md", subtitle_file_path="/tmp/subtitle.srt")
         self.mock_transcript_to_draft_usecase.execute.return_value = draft_result
 
-        self.mock_google_drive_client.upload_file.side_effect = ["draft_url", "subtitle_url", "video_url", "transcript_url"]
+        # アップロードは並列実行されるため、呼び出し順ではなくファイルパスでURLを返す
+        upload_urls = {
+            "/tmp/draft.md": "draft_url",
+            "/tmp/subtitle.srt": "subtitle_url",
+            "/tmp/test_video.mp4": "video_url",
+            "/tmp/test_video_transcript.json": "transcript_url",
+        }
+        self.mock_google_drive_client.upload_file.side_effect = lambda path, folder_id: upload_urls[path]
 
         with patch("tempfile.TemporaryDirectory") as mock_temp:
             mock_temp.return_value.__enter__.return_value = "/tmp"
@@ -49,6 +62,11 @@ class TestGoogleDriveBatchProcessUsecase:
         assert result.video_url == "video_url"
         assert result.transcript_url == "transcript_url"
 
+        # 処理中マーカーの配置と削除
+        self.mock_google_drive_client.upload_bytes.assert_called_once_with(b"", "subfolder_id", ".processing")
+        # 新規作成したフォルダには古いマーカーがないため、検索はマーカー削除時の1回のみ
+        assert self.mock_google_drive_client.find_files_by_name.call_count == 1
+
     def test_execute_drive_batch_no_unprocessed_videos(self):
         """未処理動画がない場合のテスト"""
         self.usecase._find_unprocessed_video_from_drive = Mock(return_value=None)  # type: ignore[method-assign]
@@ -67,12 +85,102 @@ class TestGoogleDriveBatchProcessUsecase:
         folder = DriveFolder("folder_id", video_files)
         self.mock_google_drive_client.list_files.return_value = folder
         self.mock_google_drive_client.extract_folder_id.return_value = "output_id"
-        self.mock_google_drive_client.folder_exists.side_effect = [True, False]
+        self.mock_google_drive_client.find_folder_id.side_effect = ["subfolder_id", None]
 
         result = self.usecase._find_unprocessed_video_from_drive("input_url", "output_url")
 
         assert result is not None
         assert result.name == "video2.mp4"
+        # 動画1本につきフォルダ検索は1回だけ行い、同じ問い合わせを繰り返さない
+        assert self.mock_google_drive_client.find_folder_id.call_count == 2
+        self.mock_google_drive_client.folder_exists.assert_not_called()
+        self.mock_google_drive_client.find_files_by_name.assert_called_once_with("subfolder_id", ".processing")
+
+    def test_find_unprocessed_video_from_drive_resumes_abandoned_video(self):
+        """クラッシュした実行の古い処理中マーカーが残っている動画は再処理対象になる"""
+        video_files = [
+            DriveFile(name="video1.mp4", file_id="id1", download_url="url1", mime_type="video/mp4"),
+            DriveFile(name="video2.mp4", file_id="id2", download_url="url2", mime_type="video/mp4"),
+        ]
+        self.mock_google_drive_client.list_files.return_value = DriveFolder("folder_id", video_files)
+        self.mock_google_drive_client.extract_folder_id.return_value = "output_id"
+        self.mock_google_drive_client.find_folder_id.return_value = "subfolder_id"
+        self.mock_google_drive_client.find_files_by_name.return_value = [{"id": "marker_id", "createdTime": "2025-01-01T00:00:00.000Z"}]
+
+        result = self.usecase._find_unprocessed_video_from_drive("input_url", "output_url")
+
+        assert result is not None
+        assert result.name == "video1.mp4"
+
+    def test_find_unprocessed_video_from_drive_skips_video_in_progress(self):
+        """新しい処理中マーカーがある動画は別の実行が処理中とみなしてスキップする"""
+        video_files = [DriveFile(name="video1.mp4", file_id="id1", download_url="url1", mime_type="video/mp4")]
+        self.mock_google_drive_client.list_files.return_value = DriveFolder("folder_id", video_files)
+        self.mock_google_drive_client.extract_folder_id.return_value = "output_id"
+        self.mock_google_drive_client.find_folder_id.return_value = "subfolder_id"
+        created_time = datetime.now(JST).isoformat(timespec="milliseconds")
+        self.mock_google_drive_client.find_files_by_name.return_value = [{"id": "marker_id", "createdTime": created_time}]
+
+        result = self.usecase._find_unprocessed_video_from_drive("input_url", "output_url")
+
+        assert result is None
+
+    def test_prepare_output_subfolder_reuses_existing_folder(self):
+        """既存の出力サブフォルダがある場合は作成せずにそのIDを使うテスト"""
+        self.mock_google_drive_client.find_folder_id.return_value = "existing_id"
+
+        self.mock_google_drive_client.find_files_by_name.return_value = [{"id": "old_marker_id", "createdTime": "2025-01-01T00:00:00.000Z"}]
+
+        assert self.usecase._prepare_output_subfolder("output_id", "video1") == "existing_id"
+        self.mock_google_drive_client.find_folder_id.assert_called_once_with("output_id", "video1")
+        self.mock_google_drive_client.create_folder.assert_not_called()
+        # 古いマーカーを置き換える
+        self.mock_google_drive_client.delete_file.assert_called_once_with("old_marker_id")
+        self.mock_google_drive_client.upload_bytes.assert_called_once_with(b"", "existing_id", ".processing")
+
+    def test_prepare_output_subfolder_creates_missing_folder(self):
+        """出力サブフォルダがない場合は作成し、すぐに処理中マーカーを配置するテスト"""
+        self.mock_google_drive_client.create_folder.return_value = "new_id"
+
+        assert self.usecase._prepare_output_subfolder("output_id", "video1") == "new_id"
+        self.mock_google_drive_client.create_folder.assert_called_once_with("video1", "output_id")
+        self.mock_google_drive_client.upload_bytes.assert_called_once_with(b"", "new_id", ".processing")
+        self.mock_google_drive_client.delete_file.assert_not_called()
+
+    def test_prepare_output_subfolder_removes_folder_without_marker(self):
+        """処理中マーカーを配置できなかった場合は、処理済みと誤認されないよう作成したフォルダを削除するテスト"""
+        self.mock_google_drive_client.create_folder.return_value = "new_id"
+        self.mock_google_drive_client.upload_bytes.side_effect = GoogleDriveError("アップロード失敗")
+
+        with pytest.raises(GoogleDriveError):
+            self.usecase._prepare_output_subfolder("output_id", "video1")
+
+        self.mock_google_drive_client.delete_file.assert_called_once_with("new_id")
+
+    def test_parse_drive_timestamp(self):
+        """Google Driveの「Z」付き日時文字列をUTCとして解析するテスト"""
+        parsed = self.usecase._parse_drive_timestamp("2025-01-01T09:00:00.000Z")
+
+        assert parsed == datetime(2025, 1, 1, 18, 0, tzinfo=JST)
+        assert parsed.utcoffset() is not None
+
+    def test_select_temp_dir_base_disabled(self):
+        """tmpfsが無効な場合はデフォルトの一時ディレクトリを使うテスト"""
+        video_file = DriveFile(name="video.mp4", file_id="id1", download_url="url1", mime_type="video/mp4", size=1024)
+
+        assert self.usecase._select_temp_dir_base(video_file) is None
+
+    def test_select_temp_dir_base_uses_tmpfs_when_enough_space(self):
+        """空き容量が動画サイズの2倍を超える場合はtmpfsを使うテスト"""
+        self.usecase.use_tmpfs = True
+        video_file = DriveFile(name="video.mp4", file_id="id1", download_url="url1", mime_type="video/mp4", size=1024)
+
+        with patch("os.path.isdir", return_value=True), patch("shutil.disk_usage") as mock_disk_usage:
+            mock_disk_usage.return_value.free = 4096
+            assert self.usecase._select_temp_dir_base(video_file) == "/dev/shm"
+
+            mock_disk_usage.return_value.free = 2048
+            assert self.usecase._select_temp_dir_base(video_file) is None
 
     def test_is_video_file(self):
         """動画ファイル判定のテスト"""
@@ -81,3 +189,20 @@ class TestGoogleDriveBatchProcessUsecase:
 
         assert self.usecase._is_video_file(video_file) is True
         assert self.usecase._is_video_file(non_video_file) is False
+
+    def test_upload_files_reuses_worker_threads(self):
+        """アップロードのワーカースレッドが実行をまたいで使い回されるテスト"""
+        # Threadオブジェクトを保持するため、終了したスレッドの識別子が再利用されても区別できる
+        upload_threads = set()
+
+        def upload_file(path, folder_id):
+            upload_threads.add(threading.current_thread())
+            return f"{folder_id}/{path}"
+
+        self.mock_google_drive_client.upload_file.side_effect = upload_file
+
+        results = [self.usecase._upload_files(["draft", "subtitle"], f"folder{i}") for i in range(10)]
+
+        assert results == [[f"folder{i}/draft", f"folder{i}/subtitle"] for i in range(10)]
+        assert 0 < len(upload_threads) <= UPLOAD_MAX_WORKERS
+        assert threading.current_thread() not in upload_threads
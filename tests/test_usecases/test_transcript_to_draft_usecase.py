@@ -0,0 +1,312 @@
+"""TranscriptToDraftUsecaseのテスト"""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.builders.prompt_builder import PromptBuilder
+from src.models.hooks import DetailedScript, HookItem, HooksExtractionResult
+from src.models.transcription import TranscriptionResult, TranscriptionSegment
+from src.service.llm_cache import LLMCache
+from src.usecases import transcript_to_draft_usecase
+from src.usecases.transcript_to_draft_usecase import DraftGenerationError, TranscriptInputValidationError, TranscriptToDraftUsecase
+
+SEGMENTS = [TranscriptionSegment(0.0, 10.0, "テスト")]
+TRANSCRIPTION = TranscriptionResult(segments=SEGMENTS, full_text="テスト")
+HOOK_ITEMS = [HookItem(f"フック{i}", "フック2", "フック3", f"要約{i}") for i in range(3)]
+
+
+# 詳細台本2件分の企画書Markdown（行のリストを"\n"で連結していた従来の出力と同じ内容）
+EXPECTED_DRAFT_MARKDOWN = """# 詳細台本集
+
+**元動画**: video
+**生成日時**: 2025-01-01 09:00:00
+**台本数**: 2
+
+---
+
+## フック1: 要約0
+
+**想定時間**: 60秒
+
+### フック詳細
+- **First Hook**: フック0
+- **Second Hook**: フック2
+- **Third Hook**: フック3
+
+### 台本内容
+【台本構成】
+[00:00–00:06] ナレーション
+
+---
+
+## フック2: 要約1
+
+**想定時間**: 45秒
+
+### フック詳細
+- **First Hook**: フック1
+- **Second Hook**: フック2
+- **Third Hook**: フック3
+
+### 台本内容
+台本2
+
+---
+"""
+
+
+def make_script(hook_item: HookItem) -> DetailedScript:
+    """テスト用の詳細台本を生成"""
+    return DetailedScript(hook_item=hook_item, script_content=f"台本{hook_item.summary}", duration_seconds=60, segments_used=SEGMENTS)
+
+
+def write_transcript_file(directory: Path) -> Path:
+    """テスト用の文字起こしファイルを作成"""
+    transcript_file = directory / "video_transcript.json"
+    transcript_file.write_text(json.dumps({"segments": [asdict(segment) for segment in SEGMENTS], "full_text": "テスト"}), encoding="utf-8")
+    return transcript_file
+
+
+class TestTranscriptToDraftUsecase:
+    """TranscriptToDraftUsecaseのテストクラス"""
+
+    def setup_method(self):
+        """テストセットアップ"""
+        self.mock_chatgpt_client = Mock()
+        self.mock_chatgpt_client.model = "gpt-4"
+        # 生成結果は完了順に返るため、逆順で返して並べ直しを確認できるようにする
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.side_effect = lambda hook_items, segments, prompt_builder: [
+            make_script(hook_item) for hook_item in reversed(hook_items)
+        ]
+        self.mock_srt_generator = Mock()
+        self.mock_srt_generator.generate_srt_file.side_effect = lambda transcription, output_path: output_path
+        self.prompt_builder = PromptBuilder()
+
+    def make_usecase(self, llm_cache: LLMCache | None = None) -> TranscriptToDraftUsecase:
+        """テスト対象のユースケースを生成"""
+        return TranscriptToDraftUsecase(self.mock_chatgpt_client, self.prompt_builder, self.mock_srt_generator, llm_cache)
+
+    def test_extract_hooks_phase_cache_hit(self, tmp_path):
+        """フック抽出結果がキャッシュにある場合はAPIを呼び出さないテスト"""
+        cache = LLMCache(str(tmp_path))
+        usecase = self.make_usecase(cache)
+        cache_key = cache.make_key(phase="hooks", model="gpt-4", prompt=self.prompt_builder.build_hooks_prompt(TRANSCRIPTION))
+        cache.set(cache_key, [asdict(item) for item in HOOK_ITEMS])
+
+        result = usecase._extract_hooks_phase(TRANSCRIPTION)
+
+        assert result.items == HOOK_ITEMS
+        self.mock_chatgpt_client.extract_hooks.assert_not_called()
+
+    def test_extract_hooks_phase_cache_miss(self, tmp_path):
+        """フック抽出結果がキャッシュにない場合はAPIを呼び出して保存するテスト"""
+        cache = LLMCache(str(tmp_path))
+        usecase = self.make_usecase(cache)
+        self.mock_chatgpt_client.extract_hooks.return_value = HOOK_ITEMS
+
+        first = usecase._extract_hooks_phase(TRANSCRIPTION)
+        second = usecase._extract_hooks_phase(TRANSCRIPTION)
+
+        assert first.items == HOOK_ITEMS
+        assert second.items == HOOK_ITEMS
+        self.mock_chatgpt_client.extract_hooks.assert_called_once()
+
+    def test_extract_hooks_phase_ignores_malformed_cache(self, tmp_path):
+        """形式が不正なフック抽出キャッシュはキャッシュミスとして扱うテスト"""
+        cache = LLMCache(str(tmp_path))
+        usecase = self.make_usecase(cache)
+        cache_key = cache.make_key(phase="hooks", model="gpt-4", prompt=self.prompt_builder.build_hooks_prompt(TRANSCRIPTION))
+        cache.set(cache_key, [{"first_hook": "フック"}])
+        self.mock_chatgpt_client.extract_hooks.return_value = HOOK_ITEMS
+
+        result = usecase._extract_hooks_phase(TRANSCRIPTION)
+
+        assert result.items == HOOK_ITEMS
+        self.mock_chatgpt_client.extract_hooks.assert_called_once()
+        assert cache.get(cache_key) == [asdict(item) for item in HOOK_ITEMS]
+
+    def test_generate_scripts_phase_cache_miss(self, tmp_path):
+        """詳細台本がキャッシュにない場合は全フックを生成し、フックの順序で返すテスト"""
+        cache = LLMCache(str(tmp_path))
+        usecase = self.make_usecase(cache)
+
+        scripts = usecase._generate_scripts_phase(HooksExtractionResult(items=HOOK_ITEMS, original_transcription=TRANSCRIPTION))
+
+        assert [script.hook_item for script in scripts] == HOOK_ITEMS
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.assert_called_once_with(HOOK_ITEMS, SEGMENTS, self.prompt_builder)
+        for hook_item in HOOK_ITEMS:
+            cached_script = cache.get(usecase._make_script_cache_key(cache, hook_item, SEGMENTS))
+            assert cached_script == {"script_content": f"台本{hook_item.summary}", "duration_seconds": 60}
+
+    def test_generate_scripts_phase_cache_hit(self, tmp_path):
+        """詳細台本が全てキャッシュにある場合はAPIを呼び出さないテスト"""
+        cache = LLMCache(str(tmp_path))
+        usecase = self.make_usecase(cache)
+        hooks_result = HooksExtractionResult(items=HOOK_ITEMS, original_transcription=TRANSCRIPTION)
+        usecase._generate_scripts_phase(hooks_result)
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.reset_mock()
+
+        scripts = usecase._generate_scripts_phase(hooks_result)
+
+        assert scripts == [make_script(hook_item) for hook_item in HOOK_ITEMS]
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.assert_not_called()
+
+    def test_generate_scripts_phase_partial_cache_hit(self, tmp_path):
+        """一部のみキャッシュにある場合は残りだけを生成し、フックの順序を維持するテスト"""
+        cache = LLMCache(str(tmp_path))
+        usecase = self.make_usecase(cache)
+        cache.set(usecase._make_script_cache_key(cache, HOOK_ITEMS[1], SEGMENTS), {"script_content": "キャッシュ台本", "duration_seconds": 30})
+
+        scripts = usecase._generate_scripts_phase(HooksExtractionResult(items=HOOK_ITEMS, original_transcription=TRANSCRIPTION))
+
+        assert [script.hook_item for script in scripts] == HOOK_ITEMS
+        assert scripts[1].script_content == "キャッシュ台本"
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.assert_called_once_with([HOOK_ITEMS[0], HOOK_ITEMS[2]], SEGMENTS, self.prompt_builder)
+
+    def test_generate_scripts_phase_ignores_malformed_cache(self, tmp_path):
+        """形式が不正な詳細台本キャッシュはキャッシュミスとして扱うテスト"""
+        cache = LLMCache(str(tmp_path))
+        usecase = self.make_usecase(cache)
+        cache_key = usecase._make_script_cache_key(cache, HOOK_ITEMS[0], SEGMENTS)
+        cache.set(cache_key, {"content": "古い形式"})
+
+        scripts = usecase._generate_scripts_phase(HooksExtractionResult(items=HOOK_ITEMS[:1], original_transcription=TRANSCRIPTION))
+
+        assert scripts == [make_script(HOOK_ITEMS[0])]
+        assert cache.get(cache_key) == {"script_content": "台本要約0", "duration_seconds": 60}
+
+    def test_execute_batch_mode_uses_batch_api(self, tmp_path):
+        """mode="batch"ではBatch API版のメソッドでフック抽出・台本生成を行うテスト"""
+        transcript_file = write_transcript_file(tmp_path)
+        self.mock_chatgpt_client.extract_hooks_batch.return_value = HOOK_ITEMS
+        self.mock_chatgpt_client.generate_detailed_scripts_batch.side_effect = lambda hook_items, segments, prompt_builder: [
+            make_script(hook_item) for hook_item in hook_items
+        ]
+        usecase = self.make_usecase()
+
+        result = usecase.execute(str(transcript_file), str(tmp_path / "output"), mode="batch")
+
+        assert result.success is True
+        self.mock_chatgpt_client.extract_hooks_batch.assert_called_once()
+        self.mock_chatgpt_client.generate_detailed_scripts_batch.assert_called_once_with(HOOK_ITEMS, SEGMENTS, self.prompt_builder)
+        self.mock_chatgpt_client.extract_hooks.assert_not_called()
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.assert_not_called()
+
+    def test_deduplicate_hook_items(self):
+        """全角・半角、大文字・小文字、空白の違いを無視して重複を除き、最初の出現を残すテスト"""
+        usecase = self.make_usecase()
+        first = HookItem("ＡＢＣ１２３", "Second Hook", "第三の フック", "要約")
+        hook_items = [
+            first,
+            HookItem("ABC123", "second hook", "第三のフック", "要約"),
+            HookItem("abc123", "SECOND　HOOK", " 第三の\tフック ", "要約"),
+            HookItem("ABC123", "second hook", "第三のフック", "別の要約"),
+        ]
+
+        result = usecase._deduplicate_hook_items(hook_items)
+
+        assert result == [first, hook_items[3]]
+        assert result[0] is first
+
+    def test_extract_hooks_phase_deduplicates_items(self):
+        """フック抽出結果から重複が除かれ、フックJSONと企画書で同じフックが出力されるテスト"""
+        usecase = self.make_usecase()
+        self.mock_chatgpt_client.extract_hooks.return_value = [HOOK_ITEMS[0], HookItem("フック0", "フック２", "フック3", "要約0"), HOOK_ITEMS[1]]
+
+        result = usecase._extract_hooks_phase(TRANSCRIPTION)
+
+        assert result.items == [HOOK_ITEMS[0], HOOK_ITEMS[1]]
+
+    def test_execute_subtitle_failure_skips_script_generation(self, tmp_path):
+        """字幕の生成に失敗した場合は台本生成を行わずに失敗を返すテスト"""
+        transcript_file = write_transcript_file(tmp_path)
+        self.mock_chatgpt_client.extract_hooks.return_value = HOOK_ITEMS
+        self.mock_srt_generator.generate_srt_file.side_effect = OSError("書き込み失敗")
+
+        result = self.make_usecase().execute(str(transcript_file), str(tmp_path / "output"))
+
+        assert result.success is False
+        assert "字幕ファイルの生成に失敗しました" in (result.error_message or "")
+        self.mock_chatgpt_client.generate_detailed_scripts_parallel.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "failing_step",
+        ["subtitle", "hooks", "scripts"],
+    )
+    def test_execute_failure_removes_subtitle_file(self, tmp_path, failing_step):
+        """どの段階で失敗しても、書きかけを含む字幕ファイルを残さないテスト"""
+        transcript_file = write_transcript_file(tmp_path)
+        output_dir = tmp_path / "output"
+        self.mock_chatgpt_client.extract_hooks.return_value = HOOK_ITEMS
+        if failing_step == "hooks":
+            self.mock_chatgpt_client.extract_hooks.side_effect = RuntimeError("API失敗")
+        if failing_step == "scripts":
+            self.mock_chatgpt_client.generate_detailed_scripts_parallel.side_effect = RuntimeError("API失敗")
+
+        def generate_srt_file(transcription, output_path):
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write("1\n")
+                if failing_step == "subtitle":
+                    raise OSError("書き込み失敗")
+            return output_path
+
+        self.mock_srt_generator.generate_srt_file.side_effect = generate_srt_file
+
+        result = self.make_usecase().execute(str(transcript_file), str(output_dir))
+
+        assert result.success is False
+        assert list(output_dir.iterdir()) == []
+
+    def test_load_transcript_success(self, tmp_path):
+        """正しい形式の文字起こしファイルを読み込めるテスト"""
+        transcription = self.make_usecase()._load_transcript(str(write_transcript_file(tmp_path)))
+
+        assert transcription == TRANSCRIPTION
+
+    def test_load_transcript_too_large(self, tmp_path, monkeypatch):
+        """上限を超えるサイズの文字起こしファイルを拒否するテスト"""
+        transcript_file = write_transcript_file(tmp_path)
+        monkeypatch.setattr(transcript_to_draft_usecase, "MAX_TRANSCRIPT_BYTES", transcript_file.stat().st_size - 1)
+
+        with pytest.raises(DraftGenerationError, match="文字起こしファイルが大きすぎます"):
+            self.make_usecase()._load_transcript(str(transcript_file))
+
+    def test_load_transcript_segments_not_list(self, tmp_path):
+        """segmentsがリストでない文字起こしファイルを拒否するテスト"""
+        transcript_file = tmp_path / "video_transcript.json"
+        transcript_file.write_text(json.dumps({"segments": {"start_time": 0.0, "end_time": 1.0, "text": "テスト"}, "full_text": "テスト"}), encoding="utf-8")
+
+        with pytest.raises(DraftGenerationError, match="segmentsがリストではありません"):
+            self.make_usecase()._load_transcript(str(transcript_file))
+
+    def test_save_detailed_scripts_output(self, tmp_path):
+        """企画書Markdownの出力内容が従来の形式と完全に一致するテスト"""
+        scripts = [
+            DetailedScript(HOOK_ITEMS[0], "【台本構成】\n[00:00–00:06] ナレーション", 60, SEGMENTS),
+            DetailedScript(HOOK_ITEMS[1], "台本2", 45, SEGMENTS),
+        ]
+
+        file_path = self.make_usecase()._save_detailed_scripts(scripts, "video", tmp_path, "2025-01-01 09:00:00")
+
+        assert file_path == str(tmp_path / "企画案_video.md")
+        assert (tmp_path / "企画案_video.md").read_bytes() == EXPECTED_DRAFT_MARKDOWN.encode("utf-8")
+
+    def test_validate_input_valid_file(self, tmp_path):
+        """存在する文字起こしファイルは検証を通過するテスト"""
+        self.make_usecase()._validate_input(str(write_transcript_file(tmp_path)), str(tmp_path / "output"))  # 例外が発生しないことを確認
+
+    def test_validate_input_missing_file(self, tmp_path):
+        """存在しないパスを拒否するテスト"""
+        with pytest.raises(TranscriptInputValidationError, match="文字起こしファイルが存在しません") as cm:
+            self.make_usecase()._validate_input(str(tmp_path / "missing.json"), str(tmp_path / "output"))
+        assert cm.value.field_name == "transcript_file_path"
+
+    def test_validate_input_directory(self, tmp_path):
+        """ディレクトリのパスを拒否するテスト"""
+        with pytest.raises(TranscriptInputValidationError, match="指定されたパスはファイルではありません") as cm:
+            self.make_usecase()._validate_input(str(tmp_path), str(tmp_path / "output"))
+        assert cm.value.field_name == "transcript_file_path"
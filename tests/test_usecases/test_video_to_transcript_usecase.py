@@ -0,0 +1,37 @@
+"""VideoToTranscriptUsecaseのテスト"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.usecases.video_to_transcript_usecase import VideoInputValidationError, VideoToTranscriptUsecase
+
+
+class TestVideoToTranscriptUsecase:
+    """VideoToTranscriptUsecaseのテストクラス"""
+
+    def setup_method(self):
+        """テストセットアップ"""
+        self.usecase = VideoToTranscriptUsecase(Mock())
+
+    def test_validate_input_valid_file(self, tmp_path):
+        """存在する動画ファイルは検証を通過するテスト"""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"")
+
+        self.usecase._validate_input(str(video_file), str(tmp_path / "intermediate"))  # 例外が発生しないことを確認
+
+    def test_validate_input_missing_file(self, tmp_path):
+        """存在しないパスを拒否するテスト"""
+        with pytest.raises(VideoInputValidationError, match="動画ファイルが存在しません") as cm:
+            self.usecase._validate_input(str(tmp_path / "missing.mp4"), str(tmp_path / "intermediate"))
+        assert cm.value.field_name == "video_path"
+
+    def test_validate_input_directory(self, tmp_path):
+        """ディレクトリのパスを拒否するテスト"""
+        video_dir = tmp_path / "video.mp4"
+        video_dir.mkdir()
+
+        with pytest.raises(VideoInputValidationError, match="指定されたパスはファイルではありません") as cm:
+            self.usecase._validate_input(str(video_dir), str(tmp_path / "intermediate"))
+        assert cm.value.field_name == "video_path"